@@ -31,14 +31,30 @@ from .. import collections
 from ..utils.qa import QualityAssurance
 
 
-def getChecks():
+CHECK_CLASSES = []
+
+
+def invalidate():
     """
-    Get all checks available in this module. 
+    Clear the discovered check classes, the next time checks are requested
+    the classes will be discovered again. This can be used after new checks
+    are added to this module at runtime.
+    """
+    del CHECK_CLASSES[:]
 
-    :return: All available error checks
+
+def getCheckClasses():
+    """
+    Get all check classes available in this module. The classes are
+    discovered and sorted once, the result is cached until invalidated.
+
+    :return: All available error check classes
     :rtype: list
     """
-    checks = []
+    if CHECK_CLASSES:
+        return CHECK_CLASSES
+
+    classes = []
 
     # get quality assurance checks.
     for name, obj in inspect.getmembers(sys.modules[__name__]):
@@ -48,19 +64,35 @@ def getChecks():
             and obj.__name__ != QualityAssurance.__name__
         ):
 
-            checks.append(obj())
+            classes.append(obj)
+
+    # get the location of each check in its source code, the source of each
+    # module is only retrieved once.
+    sources = {}
+    offsets = {}
+    for cls in classes:
+        module = inspect.getmodule(cls)
+        if module not in sources:
+            sources[module] = inspect.getsource(module)
+
+        offsets[cls] = sources[module].find(cls.__name__)
 
     # sort checks based on location in source code.
-    checks.sort(
-        key=lambda x:
-            inspect.getsource(
-                inspect.getmodule(x)
-            ).find(
-                x.__class__.__name__
-            )
-    )
+    classes.sort(key=lambda x: offsets[x])
+
+    CHECK_CLASSES.extend(classes)
+    return CHECK_CLASSES
+
+
+def getChecks():
+    """
+    Get all checks available in this module. New instances are created
+    every time, as the checks store their own state.
 
-    return checks
+    :return: All available error checks
+    :rtype: list
+    """
+    return [cls() for cls in getCheckClasses()]
 
 
 def getChecksFromCollection(collection):
@@ -75,7 +107,7 @@ def getChecksFromCollection(collection):
     """
     data = getChecksSplitByCategory()
 
-    categories = getChecksCategories()
+    categories = data.keys()
     categories = collections.getCollections().get(collection) or categories
 
     return OrderedDict(
@@ -99,7 +131,7 @@ def getChecksSplitByCategory():
 
     for check in getChecks():
         for category in check.categories:
-            if category not in data.keys():
+            if category not in data:
                 data[category] = []
 
             data[category].append(check)
@@ -1,5 +1,5 @@
-from maya import cmds
-from ..utils import QualityAssurance, animation, reference
+from maya import cmds, OpenMaya
+from ..utils import QualityAssurance, animation, api
 
 
 class NotConnectedAnimation(QualityAssurance):
@@ -22,16 +22,23 @@ class NotConnectedAnimation(QualityAssurance):
         :return: Animation curves without output connection
         :rtype: generator
         """
-        animCurves = self.ls(type="animCurve")
-        animCurves = reference.removeReferenced(animCurves)
+        obj = OpenMaya.MObject()
+        iterator = self.lsApi(nodeType=OpenMaya.MFn.kAnimCurve)
+        while not iterator.isDone():
+            iterator.getDependNode(obj)
+            iterator.next()
+
+            # filter referenced animation curves
+            depNode = OpenMaya.MFnDependencyNode(obj)
+            if depNode.isFromReferencedFile():
+                continue
 
-        for animCurve in animCurves:
             # check if the output plug is connected
-            if cmds.listConnections("{0}.output".format(animCurve)):
+            if depNode.findPlug("output", False).isConnected():
                 continue
 
             # yield error
-            yield animCurve
+            yield depNode.name()
 
     def _fix(self, animCurve):
         """
@@ -60,20 +67,44 @@ class ComponentAnimation(QualityAssurance):
         :return: Animation curves connected to meshes
         :rtype: generator
         """
-        meshes = self.ls(type="mesh")
-        for mesh in meshes:
-            # get connected animation curves
-            animCurves = cmds.listConnections(
-                "{0}.pnts".format(mesh),
-                type="animCurve"
-            ) or []
+        meshes = set(self.ls(type="mesh", l=True))
+        if not meshes:
+            return
+
+        connected = OpenMaya.MPlugArray()
+        iterator = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kAnimCurve)
+        while not iterator.isDone():
+            depNode = OpenMaya.MFnDependencyNode(iterator.thisNode())
+            iterator.next()
 
             # filter referenced animation curves
-            animCurves = reference.removeReferenced(animCurves)
+            if depNode.isFromReferencedFile():
+                continue
 
-            # yield error
-            for animCurve in animCurves:
-                yield animCurve
+            # get destinations of the output plug
+            output = depNode.findPlug("output", False)
+            output.connectedTo(connected, False, True)
+
+            for i in range(connected.length()):
+                plug = connected[i]
+                if not plug.node().hasFn(OpenMaya.MFn.kMesh):
+                    continue
+
+                # get the array plug of the destination
+                if plug.isChild():
+                    plug = plug.parent()
+                if plug.isElement():
+                    plug = plug.array()
+
+                attribute = OpenMaya.MFnAttribute(plug.attribute()).name()
+                if attribute != "pnts":
+                    continue
+
+                # yield error if connected to the points of a listed mesh
+                mesh = OpenMaya.MDagPath.getAPathTo(plug.node())
+                if mesh.fullPathName() in meshes:
+                    yield depNode.name()
+                    break
 
     def _fix(self, animCurve):
         """
@@ -104,22 +135,30 @@ class SubFrameAnimation(QualityAssurance):
         :return: Animation curves with sub-frame keys
         :rtype: generator
         """
-        animCurves = self.ls(type="animCurve")
-        animCurves = reference.removeReferenced(animCurves)
-        animCurves = animation.removeDrivenAnimCurves(animCurves)
-
-        for animCurve in animCurves:
-            frames = cmds.keyframe(
-                animCurve,
-                query=True,
-                timeChange=True
-            ) or []
+        animCurves = api.toNames(self.lsApi(OpenMaya.MFn.kAnimCurve))
+        animCurves = animation.filterAnimCurves(animCurves)
+
+        if not animCurves:
+            return
+
+        # query the frames of all animation curves at once, the key counts
+        # are used to partition the flat list of frames per animation curve
+        frames = cmds.keyframe(
+            animCurves,
+            query=True,
+            timeChange=True
+        ) or []
+        counts = animation.getKeyframeCounts(animCurves)
 
-            for f in frames:
-                if round(f, 0) != f:
+        offset = 0
+        for animCurve, count in zip(animCurves, counts):
+            for f in frames[offset:offset + count]:
+                if f != int(f):
                     yield animCurve
                     break
 
+            offset += count
+
     def _fix(self, animCurve):
         """
         :param str animCurve:
@@ -129,7 +168,7 @@ class SubFrameAnimation(QualityAssurance):
 
         # loop each key
         for i, f in enumerate(frames):
-            if round(f, 0) != f:
+            if f != int(f):
                 cmds.keyframe(animCurve, index=(i,), tc=round(f, 0))
 
 
@@ -153,28 +192,20 @@ class TemplateAnimation(QualityAssurance):
         :return: Animation curves that have templated keys
         :rtype: generator
         """
-        animCurves = self.ls(type="animCurve")
-        animCurves = reference.removeReferenced(animCurves)
-        animCurves = animation.removeDrivenAnimCurves(animCurves)
+        animCurves = api.toNames(self.lsApi(OpenMaya.MFn.kAnimCurve))
+        animCurves = animation.filterAnimCurves(animCurves)
 
         for animCurve in animCurves:
-            size = cmds.getAttr("{0}.ktv".format(animCurve), size=True)
-
-            for i in range(size):
-                if cmds.getAttr("{0}.ktv[{1}]".format(animCurve, i), lock=True):
-                    yield animCurve
-                    break
+            if animation.getLockedKeys(animCurve):
+                yield animCurve
 
     def _fix(self, animCurve):
         """
         :param str animCurve:
         """
-        # get number of keys
-        size = cmds.getAttr("{0}.ktv".format(animCurve), size=True)
-
-        # unlock each key
-        for i in range(size):
-            cmds.setAttr("{0}.ktv[{1}]".format(animCurve, i), lock=0)
+        # unlock each locked key
+        for key in animation.getLockedKeys(animCurve):
+            cmds.setAttr(key, lock=0)
 
         # unlock entire channel
         cmds.setAttr("{0}.ktv".format(animCurve), lock=0)
@@ -226,6 +257,11 @@ class CleanAnimation(QualityAssurance):
             ) or []
         ]
 
+        # get in tangent types
+        inTangentTypes = cmds.keyTangent(
+            animCurve, query=True, inTangentType=True
+        ) or []
+
         # get out tangent types
         outTangentTypes = cmds.keyTangent(
             animCurve, query=True, outTangentType=True
@@ -235,36 +271,51 @@ class CleanAnimation(QualityAssurance):
         frames = cmds.keyframe(animCurve, query=True, timeChange=True) or []
         values = cmds.keyframe(animCurve, query=True, valueChange=True) or []
 
-        # proces curve data
+        # classify every key once
+        stepped = [t == "step" for t in outTangentTypes]
+        flatIn = [a < angle for a in inAngles]
+        flatOut = [a < angle for a in outAngles]
+        linear = [
+            i == "linear" and o == "linear"
+            for i, o in zip(inTangentTypes, outTangentTypes)
+        ]
+
+        # proces curve data, every key is compared to the last key that is
+        # kept rather than the previous key. this prevents the deviation of
+        # removed keys from adding up over runs of removed keys
         indices = []
-        for i in range(1, len(frames)-1):
-
-            # is stepped
-            stepped = outTangentTypes[i-1] == "step" \
-                      and outTangentTypes[i] == "step" \
-                      and outTangentTypes[i+1] == "step"
-
-            if stepped \
-                or (
-                        outAngles[i-1] < angle
-                        and inAngles[i] < angle
-                        and outAngles[i] < angle
-                        and inAngles[i+1] < angle
-                    ):
-
-                # get differences between keys
-                previousDif = abs(values[i-1] - values[i])
-                nextDif = abs(values[i+1] - values[i])
-
-                if (stepped and previousDif < size) \
-                    or (
-                        not stepped
-                        and previousDif < size
-                        and nextDif < size
-                    ):
-
-                    # append index
+        p = 0
+        for i in range(1, len(frames) - 1):
+            n = i + 1
+
+            # get differences between keys
+            previousDif = abs(values[p] - values[i]) < size
+
+            if stepped[p] and stepped[i] and stepped[n]:
+                if previousDif:
                     indices.append(i)
+                    continue
+
+            elif flatOut[p] and flatIn[i] and flatOut[i] and flatIn[n] \
+                    and previousDif and abs(values[n] - values[i]) < size:
+                indices.append(i)
+                continue
+
+            # keys on linear segments can be removed if none of the keys
+            # between the last kept key and the next key deviate from the
+            # line between them, the deviation is derived from the area of
+            # the triangle the keys form
+            elif linear[p] and linear[i] and linear[n] and all(
+                abs(
+                    (frames[j] - frames[p]) * (values[n] - values[p])
+                    - (frames[n] - frames[p]) * (values[j] - values[p])
+                ) / (frames[n] - frames[p]) < size
+                for j in range(p + 1, n)
+            ):
+                indices.append(i)
+                continue
+
+            p = i
 
         # remove curves with only 1 key
         if len(frames) <= 1:
@@ -292,9 +343,8 @@ class CleanAnimation(QualityAssurance):
         :return: Animation curves with unnessecary keys
         :rtype: generator
         """
-        animCurves = self.ls(type="animCurve")
-        animCurves = reference.removeReferenced(animCurves)
-        animCurves = animation.removeDrivenAnimCurves(animCurves)
+        animCurves = api.toNames(self.lsApi(OpenMaya.MFn.kAnimCurve))
+        animCurves = animation.filterAnimCurves(animCurves)
 
         for animCurve in animCurves:
             action, _ = self.evaluateAnimCurve(animCurve)
@@ -313,6 +363,9 @@ class CleanAnimation(QualityAssurance):
                 "{0}.output".format(animCurve), p=True
             ) or []
 
+            # filter locked plugs
+            plugs = [p for p in plugs if not api.toMPlug(p).isLocked()]
+
             # get attributes
             attributes = [
                 cmds.getAttr(p)
@@ -324,12 +377,12 @@ class CleanAnimation(QualityAssurance):
 
             # reset attributes
             for p, a in zip(plugs, attributes):
-                if cmds.getAttr(p, lock=True):
-                    continue
-
                 cmds.setAttr(p, a)
 
         elif action == "indices":
             # remove key indices
-            for i in indices[::-1]:
-                cmds.cutKey(animCurve, clear=True, index=(i, i))
+            cmds.cutKey(
+                animCurve,
+                clear=True,
+                index=[(i, i) for i in indices]
+            )
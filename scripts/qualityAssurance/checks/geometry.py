@@ -1,5 +1,6 @@
 from maya import cmds, OpenMaya
-from ..utils import QualityAssurance, reference
+from maya.api import OpenMaya as OpenMaya2
+from ..utils import QualityAssurance, api, mesh, reference
 
 
 class EmptyMesh(QualityAssurance):
@@ -23,10 +24,16 @@ class EmptyMesh(QualityAssurance):
         :rtype: generator
         """
         meshes = self.ls(type="mesh", noIntermediate=True, l=True)
-        meshes = reference.removeReferenced(meshes)
+        meshes = list(reference.removeReferenced(meshes))
 
-        for mesh in meshes:
-            if not cmds.polyEvaluate(mesh, v=True):
+        for mesh, obj in zip(meshes, api.toMObjects(meshes)):
+            # meshes without geometry data can't be attached to
+            try:
+                numVertices = OpenMaya.MFnMesh(obj).numVertices()
+            except RuntimeError:
+                numVertices = 0
+
+            if not numVertices:
                 yield mesh
 
     def _fix(self, mesh):
@@ -36,7 +43,7 @@ class EmptyMesh(QualityAssurance):
         cmds.delete(mesh)
 
 
-class EmptyMesh(QualityAssurance):
+class NonManifoldGeometry(QualityAssurance):
     """
     Find meshes that have non-manifold edges and/or faces.
     """
@@ -56,14 +63,18 @@ class EmptyMesh(QualityAssurance):
         :rtype: generator
         """
         meshes = self.ls(type="mesh", noIntermediate=True, l=True)
-        meshes = reference.removeReferenced(meshes)
+        meshes = list(reference.removeReferenced(meshes))
 
-        for mesh in meshes:
-            nmEdges = cmds.polyInfo(mesh, nonManifoldEdges=True) or []
-            nmVertices = cmds.polyInfo(mesh, nonManifoldVertices=True) or []
+        # polyInfo operates on the selection when no meshes are provided
+        if not meshes:
+            return
 
-            for error in nmEdges + nmVertices:
-                yield error
+        # query all meshes at once
+        nmEdges = cmds.polyInfo(meshes, nonManifoldEdges=True) or []
+        nmVertices = cmds.polyInfo(meshes, nonManifoldVertices=True) or []
+
+        for error in nmEdges + nmVertices:
+            yield error
 
 
 class ZeroEdgeLength(QualityAssurance):
@@ -85,36 +96,32 @@ class ZeroEdgeLength(QualityAssurance):
         :return: Zero length edges
         :rtype: generator
         """
-        # variables
-        obj = OpenMaya.MObject()
-        edgeLength = OpenMaya.MScriptUtil()
-        edgeLengthPntr = edgeLength.asDoublePtr()
-
-        # get mesh iterator
-        meshIter = self.lsApi(nodeType=OpenMaya.MFn.kMesh)
-
-        # iterate meshes
-        while not meshIter.isDone():
-            meshIter.getDependNode(obj)
-            dagNode = OpenMaya.MDagPath.getAPathTo(obj)
-            path = dagNode.fullPathName()
+        for dagPath in self.lsDagPaths(OpenMaya2.MFn.kMesh):
+            path = dagPath.fullPathName()
 
             # ignore references
-            if cmds.referenceQuery(path, inr=True):
-                meshIter.next()
+            if reference.isReferenced(path):
+                continue
+
+            # zero length edges can only exist between coincident vertices
+            vertices = mesh.getCoincidentVertices(dagPath)
+            if not vertices:
                 continue
 
             # iterate edges
-            edgeIter = OpenMaya.MItMeshEdge(dagNode)
+            edgeIter = OpenMaya2.MItMeshEdge(dagPath)
             while not edgeIter.isDone():
+                # ignore edges without coincident vertices
+                if edgeIter.vertexId(0) not in vertices:
+                    edgeIter.next()
+                    continue
+
                 # get edge length
-                edgeIter.getLength(edgeLengthPntr, OpenMaya.MSpace.kWorld)
-                if edgeLength.getDouble(edgeLengthPntr) < 0.00001:
+                if edgeIter.length(OpenMaya2.MSpace.kWorld) < 0.00001:
                     index = edgeIter.index()
                     yield "{0}.e[{1}]".format(path, index)
 
                 edgeIter.next()
-            meshIter.next()
 
 
 class ZeroAreaFaces(QualityAssurance):
@@ -136,37 +143,23 @@ class ZeroAreaFaces(QualityAssurance):
         :return: Zero area faces
         :rtype: generator
         """
-        # variables
-        obj = OpenMaya.MObject()
-        faceArea = OpenMaya.MScriptUtil()
-        faceAreaPntr = faceArea.asDoublePtr()
-
-        # get mesh iterator
-        meshIter = self.lsApi(nodeType=OpenMaya.MFn.kMesh)
-
-        # iterate meshes
-        while not meshIter.isDone():
-            meshIter.getDependNode(obj)
-            dagNode = OpenMaya.MDagPath.getAPathTo(obj)
-            path = dagNode.fullPathName()
+        for dagPath in self.lsDagPaths(OpenMaya2.MFn.kMesh):
+            path = dagPath.fullPathName()
 
             # ignore references
-            if cmds.referenceQuery(path, inr=True):
-                meshIter.next()
+            if reference.isReferenced(path):
                 continue
 
-            # iterate faces
-            faceIter = OpenMaya.MItMeshPolygon(dagNode)
-            while not faceIter.isDone():
+            # iterate faces, the faces are visited by index as the
+            # signature of next differs between versions of Maya
+            faceIter = OpenMaya2.MItMeshPolygon(dagPath)
+            for index in range(OpenMaya2.MFnMesh(dagPath).numPolygons):
+                faceIter.setIndex(index)
+
                 # get face area
-                faceIter.getArea(faceAreaPntr, OpenMaya.MSpace.kWorld)
-                if faceArea.getDouble(faceAreaPntr) < 0.00001:
-                    index = faceIter.index()
+                if faceIter.getArea(OpenMaya2.MSpace.kWorld) < 0.00001:
                     yield "{0}.f[{1}]".format(path, index)
 
-                faceIter.next()
-            meshIter.next()
-
 
 class OverlappingFaces(QualityAssurance):
     """
@@ -188,60 +181,49 @@ class OverlappingFaces(QualityAssurance):
         :return: Overlapping faces
         :rtype: generator
         """
-        # variables
-        obj = OpenMaya.MObject()
-
-        # get mesh iterator
-        meshIter = self.lsApi(nodeType=OpenMaya.MFn.kMesh)
-
-        # iterate meshes
-        while not meshIter.isDone():
+        for dagPath in self.lsDagPaths(OpenMaya2.MFn.kMesh):
             # variables
             faces = []
-            meshIter.getDependNode(obj)
-            dagNode = OpenMaya.MDagPath.getAPathTo(obj)
-            path = dagNode.fullPathName()
+            path = dagPath.fullPathName()
 
             # ignore references
-            if cmds.referenceQuery(path, inr=True):
-                meshIter.next()
+            if reference.isReferenced(path):
                 continue
 
-            # iterate faces
-            faceIter = OpenMaya.MItMeshPolygon(dagNode)
+            # get world space positions of all vertices at once
+            meshFn = OpenMaya2.MFnMesh(dagPath)
+            points = meshFn.getPoints(OpenMaya2.MSpace.kWorld)
 
-            # variable
-            allPoints = []
-            allIndices = []
-
-            # loop faces
-            while not faceIter.isDone():
-                # get world space positions
-                points = OpenMaya.MPointArray()
-                faceIter.getPoints(points, OpenMaya.MSpace.kWorld)
-
-                # sort points
-                points = [
+            # sort points
+            points = [
+                tuple(
                     sorted(
                         [
-                            round(points[i][0], 8),
-                            round(points[i][1], 8),
-                            round(points[i][2], 8)
+                            round(point.x, 8),
+                            round(point.y, 8),
+                            round(point.z, 8)
                         ]
                     )
-                    for i in range(points.length())
-                ]
+                )
+                for point in points
+            ]
 
-                # store points and indices
-                allPoints.append(str(sorted(points)))
-                allIndices.append(faceIter.index())
-
-                faceIter.next()
-            meshIter.next()
+            # get the vertices of all faces at once
+            counts, vertices = meshFn.getVertices()
+            vertices = list(vertices)
 
             # find matching faces
             seen = set()
-            for i, p in zip(allIndices, allPoints):
+            offset = 0
+            for i, count in enumerate(counts):
+                p = tuple(
+                    sorted(
+                        points[v]
+                        for v in vertices[offset:offset + count]
+                    )
+                )
+                offset += count
+
                 if p not in seen:
                     seen.add(p)
                     continue
@@ -281,36 +263,21 @@ class NGonFaces(QualityAssurance):
         :return: N-Gon faces
         :rtype: generator
         """
-        # variables
-        obj = OpenMaya.MObject()
-
-        # get mesh iterator
-        meshIter = self.lsApi(nodeType=OpenMaya.MFn.kMesh)
-
-        # iterate meshes
-        while not meshIter.isDone():
-            faces = []
-
-            meshIter.getDependNode(obj)
-            dagNode = OpenMaya.MDagPath.getAPathTo(obj)
-            path = dagNode.fullPathName()
+        for dagPath in self.lsDagPaths(OpenMaya2.MFn.kMesh):
+            path = dagPath.fullPathName()
 
             # ignore references
-            if cmds.referenceQuery(path, inr=True):
-                meshIter.next()
+            if reference.isReferenced(path):
                 continue
 
-            # iterate faces
-            faceIter = OpenMaya.MItMeshPolygon(dagNode)
+            # get the vertex count of all faces at once
+            counts, _ = OpenMaya2.MFnMesh(dagPath).getVertices()
 
-            # loop faces
-            while not faceIter.isDone():
-                if faceIter.polygonVertexCount() > 4:
-                    index = faceIter.index()
-                    faces.append("{0}.f[{1}]".format(path, index))
-
-                faceIter.next()
-            meshIter.next()
+            faces = [
+                "{0}.f[{1}]".format(path, i)
+                for i, count in enumerate(counts)
+                if count > 4
+            ]
 
             # if no error faces continue
             if not faces:
@@ -345,12 +312,16 @@ class LaminaFaces(QualityAssurance):
         :rtype: generator
         """
         meshes = self.ls(type="mesh", noIntermediate=True, l=True)
-        meshes = reference.removeReferenced(meshes)
+        meshes = list(reference.removeReferenced(meshes))
+
+        # polyInfo operates on the selection when no meshes are provided
+        if not meshes:
+            return
 
-        for mesh in meshes:
-            laminaFaces = cmds.polyInfo(mesh, laminaFaces=True) or []
-            for error in laminaFaces:
-                yield error
+        # query all meshes at once
+        laminaFaces = cmds.polyInfo(meshes, laminaFaces=True) or []
+        for error in laminaFaces:
+            yield error
 
 
 class LockedNormals(QualityAssurance):
@@ -377,17 +348,15 @@ class LockedNormals(QualityAssurance):
         :rtype: generator
         """
         meshes = self.ls(type="mesh", noIntermediate=True, l=True)
-        meshes = reference.removeReferenced(meshes)
-
-        for mesh in meshes:
-            normals = cmds.polyNormalPerVertex(
-                "{0}.vtx[*]".format(mesh),
-                query=True,
-                freezeNormal=True
-            )
-
-            if True in normals:
-                yield mesh
+        meshes = list(reference.removeReferenced(meshes))
+
+        for mesh, obj in zip(meshes, api.toMObjects(meshes)):
+            # exit on the first locked normal
+            meshFn = OpenMaya.MFnMesh(obj)
+            for i in range(meshFn.numNormals()):
+                if meshFn.isNormalLocked(i):
+                    yield mesh
+                    break
 
     def _fix(self, mesh):
         """
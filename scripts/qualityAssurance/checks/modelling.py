@@ -18,9 +18,9 @@ class FreezeTransforms(QualityAssurance):
         self._ignoreNodes = ["|persp", "|front", "|top", "|side"]
 
         self._attributes = [
-            ".tx", "ty", "tz",
-            ".rx", "ry", "rz",
-            ".sx", "sy", "sz"
+            ".tx", ".ty", ".tz",
+            ".rx", ".ry", ".rz",
+            ".sx", ".sy", ".sz"
         ]
         self._values = [
             0, 0, 0,
@@ -56,16 +56,27 @@ class FreezeTransforms(QualityAssurance):
         transforms = self.ls(transforms=True, l=True)
         transforms = reference.removeReferenced(transforms)
 
+        ignoreNodes = set(self.ignoreNodes)
+        defaults = list(self._values)
+
         for transform in transforms:
-            if transform in self.ignoreNodes:
+            if transform in ignoreNodes:
                 continue
 
-            for attr, value in self.defaultState:
-                if not cmds.objExists(transform + attr):
-                    continue
+            # get translate, rotate and scale values
+            values = cmds.xform(transform, query=True, t=True, os=True)
+            values += cmds.xform(transform, query=True, ro=True, os=True)
+            values += cmds.xform(transform, query=True, s=True, r=True)
+
+            # most transforms match the default state exactly, a single
+            # list comparison avoids comparing the values one by one
+            if values == defaults:
+                continue
 
-                if cmds.getAttr(transform + attr) != value:
+            for value, default in zip(values, defaults):
+                if abs(value - default) > 1e-7:
                     yield transform
+                    break
 
     def _fix(self, transform):
         """
@@ -120,12 +131,18 @@ class DeleteHistory(QualityAssurance):
         meshes = self.ls(type="mesh", l=True)
         meshes = reference.removeReferenced(meshes)
 
+        ignoreNodes = frozenset(self.ignoreNodes)
+
         for mesh in meshes:
             history = cmds.listHistory(mesh) or []
-            types = [cmds.nodeType(h) for h in history]
+            if not history:
+                continue
+
+            # get the node types of the entire history at once
+            types = cmds.ls(history, showType=True)[1::2]
 
             for t in types:
-                if t in self.ignoreNodes:
+                if t in ignoreNodes:
                     continue
 
                 yield mesh
@@ -1,5 +1,5 @@
 from maya import cmds
-from ..utils import QualityAssurance, reference
+from ..utils import QualityAssurance, cache, reference
 
 
 class MissingAdjustments(QualityAssurance):
@@ -31,10 +31,18 @@ class MissingAdjustments(QualityAssurance):
             currentRenderLayer=True
         )
 
+        # get shading engines
+        shadingEngines = set(cache.ls(type="shadingEngine"))
+        dagSetMembers = "{0}.dagSetMembers".format
+
+        # store destination queries, the adjustments of all components of a
+        # mesh share the same parent plug
+        destinations = {}
+
         for renderlayer in renderlayers:
             # skip if its a default layer.
             # default layers don't have render layer overrides.
-            if renderlayer.count("defaultRenderLayer"):
+            if "defaultRenderLayer" in renderlayer:
                 continue
 
             # get adjustment connections
@@ -62,14 +70,16 @@ class MissingAdjustments(QualityAssurance):
                 scnParentDstPlugs = []
 
                 scnPlug = cmds.connectionInfo(scnPlug, ges=True)
-                scnDstPlug = cmds.connectionInfo(scnPlug, dfs=True)
 
-                if scnPlug.count("objectGroups"):
+                if "objectGroups" in scnPlug:
                     scnPlugParent = scnPlug.rsplit(".", 1)[0]
-                    scnParentDstPlugs = cmds.connectionInfo(
-                        scnPlugParent,
-                        dfs=True
-                    )
+                    if scnPlugParent not in destinations:
+                        destinations[scnPlugParent] = cmds.connectionInfo(
+                            scnPlugParent,
+                            dfs=True
+                        ) or []
+
+                    scnParentDstPlugs = destinations[scnPlugParent]
 
                 SG = None
                 parentSG = None
@@ -80,7 +90,7 @@ class MissingAdjustments(QualityAssurance):
                 # get (default) shading group
                 for scnParentDstPlug in scnParentDstPlugs:
                     node = scnParentDstPlug.split(".")[0]
-                    if cmds.nodeType(node) == "shadingEngine":
+                    if node in shadingEngines:
                         SG = node
                     elif (
                         node == "defaultRenderLayer"
@@ -90,10 +100,14 @@ class MissingAdjustments(QualityAssurance):
                             "outValue",
                             "outPlug"
                         )
-                        defaultDsgPlugs = cmds.connectionInfo(
-                            defaultAdjValue,
-                            dfs=True
-                        )
+                        if defaultAdjValue not in destinations:
+                            destinations[defaultAdjValue] = \
+                                cmds.connectionInfo(
+                                    defaultAdjValue,
+                                    dfs=True
+                                ) or []
+
+                        defaultDsgPlugs = destinations[defaultAdjValue]
 
                         if defaultDsgPlugs:
                             defaultSG = defaultDsgPlugs[0].split(".")[0]
@@ -102,7 +116,7 @@ class MissingAdjustments(QualityAssurance):
                 if not SG:
                     for scnParentDstPlug in scnParentDstPlugs:
                         node = scnParentDstPlug.split(".")[0]
-                        if cmds.nodeType(node) == "shadingEngine":
+                        if node in shadingEngines:
                             parentSG = node
                             parentSGPlug = scnParentDstPlug
                             break
@@ -112,12 +126,12 @@ class MissingAdjustments(QualityAssurance):
                     if not parentSG:
                         yield [
                             scnPlug,
-                            "{0}.dagSetMembers".format(defaultSG)
+                            dagSetMembers(defaultSG)
                         ]
                     else:
                         yield [
                             scnPlug,
-                            "{0}.dagSetMembers".format(parentSG),
+                            dagSetMembers(parentSG),
                             scnPlugParent,
                             parentSGPlug
                         ]
@@ -131,7 +145,7 @@ class MissingAdjustments(QualityAssurance):
 
                 yield [
                     adjValue,
-                    "{0}.dagSetMembers".format(SG),
+                    dagSetMembers(SG),
                     scnPlugParent,
                     parentSGPlug
                 ]
@@ -172,7 +186,7 @@ class DuplicateAdjustments(QualityAssurance):
         for renderlayer in renderlayers:
             # skip if its a default layer.
             # default layers don't have render layer overrides.
-            if renderlayer.count("defaultRenderLayer"):
+            if "defaultRenderLayer" in renderlayer:
                 continue
 
             # get adjustment connections
@@ -187,10 +201,15 @@ class DuplicateAdjustments(QualityAssurance):
             source = connections[0::2]
             destination = connections[1::2]
 
-            for i, (s1, d1) in enumerate(zip(source, destination)):
-                for s2, d2 in zip(source[i+1:], destination[i+1:]):
-                    if d1 == d2:
-                        yield [d1, s1]
+            # group sources by destination
+            sources = {}
+            for s, d in zip(source, destination):
+                sources.setdefault(d, []).append(s)
+
+            # keep the last adjustment of every destination
+            for d in destination:
+                for s in sources.pop(d, [])[:-1]:
+                    yield [d, s]
 
     def _fix(self, data):
         """
@@ -228,122 +247,147 @@ class MismatchedAdjustments(QualityAssurance):
         :return: Mismatched adjustments
         :rtype: generator
         """
-        # clean references
-        references = self.ls(type="reference")
-        for reference in references:
-            if (
-                reference.count("sharedReferenceNode")
-                or not cmds.referenceQuery(reference, isLoaded=True)
-            ):
-                continue
-
-            cmds.file(cleanReference=reference)
-
         # get renderlayers
         renderlayers = self.ls(type="renderLayer")
         currentlayer = cmds.editRenderLayerGlobals(query=True, currentRenderLayer=True)
 
-        # set current renderlayer to be first
-        renderlayers.remove(currentlayer)
-        renderlayers.insert(0, currentlayer)
-
-        for renderlayer in renderlayers:
-            # skip default renderlayers
-            if renderlayer.count("defaultRenderLayer"):
-                continue
+        # get shading engines
+        shadingEngines = set(cache.ls(type="shadingEngine"))
+        dagSetMembers = "{0}.dagSetMembers".format
 
-            # get shading group overrides
-            sgOverrides = cmds.listConnections(
-                "{0}.shadingGroupOverride".format(renderlayer),
-                type="shadingEngine",
-                s=1,
+        # set current renderlayer to be first
+        renderlayers.sort(key=lambda x: x != currentlayer)
+
+        # get renderlayers with adjustments, default renderlayers don't have
+        # renderlayer overrides.
+        renderlayers = [
+            renderlayer
+            for renderlayer in renderlayers
+            if "defaultRenderLayer" not in renderlayer
+            and cmds.listConnections(
+                "{0}.outAdjustments".format(renderlayer),
                 d=0
             )
+        ]
 
-            # set current renderlayer
-            cmds.editRenderLayerGlobals(currentRenderLayer=renderlayer)
-
-            # get adjustment connections
-            connections = cmds.listConnections(
-                "{0}.outAdjustments".format(renderlayer),
-                d=0,
-                c=1,
-                p=1
-            ) or []
-
-            # iterate adjustment connections
-            connectionsIter = iter(connections)
-
-            # loop connections
-            for adjPlug in connectionsIter:
-                adjValue = adjPlug.replace("outPlug", "outValue")
-                scnPlug = connectionsIter.next()
-
-                dsgPlugs = cmds.connectionInfo(adjValue, dfs=True)
-                if not dsgPlugs:
-                    continue
-
-                SG = dsgPlugs[0].split(".")[0]
-                if sgOverrides:
-                    SG = sgOverrides[0]
-
-                nodeType = cmds.nodeType(SG)
-                if nodeType != "shadingEngine":
-                    continue
+        # the references only need to be cleaned and the renderlayers only
+        # need to be switched if there are adjustments to check
+        if not renderlayers:
+            return
 
-                scnPlugParent = ""
-                scnParentDstPlugs = []
+        # clean references
+        references = self.ls(type="reference")
+        for reference in references:
+            if (
+                "sharedReferenceNode" in reference
+                or not cmds.referenceQuery(reference, isLoaded=True)
+            ):
+                continue
 
-                scnPlug = cmds.connectionInfo(scnPlug, ges=True)
-                scnDstPlugs = cmds.connectionInfo(scnPlug, dfs=True)
+            cmds.file(cleanReference=reference)
 
-                if scnPlug.find("objectGroups") != -1:
-                    scnPlugParent = scnPlug.rsplit(".", 1)[0]
-                    scnParentDstPlugs = cmds.connectionInfo(
-                        scnPlugParent,
-                        dfs=True
-                    )
-
-                # find error in destination plugs
-                isFinished = False
-                for scnDstPlug in scnDstPlugs:
-                    node = scnDstPlug.split(".")[0]
-                    if cmds.nodeType(node) == "shadingEngine":
-                        if SG != node:
-                            yield [
-                                adjValue,
-                                "{0}.dagSetMembers".format(node),
-                                adjValue,
-                                dsgPlugs[0]
-                            ]
+        try:
+            for renderlayer in renderlayers:
+                # get shading group overrides
+                sgOverrides = cmds.listConnections(
+                    "{0}.shadingGroupOverride".format(renderlayer),
+                    type="shadingEngine",
+                    s=1,
+                    d=0
+                )
+
+                # set current renderlayer
+                cmds.editRenderLayerGlobals(currentRenderLayer=renderlayer)
+
+                # store destination queries, the adjustments of all components
+                # of a mesh share the same parent plug. the destinations depend
+                # on the current renderlayer so they are only stored per layer
+                destinations = {}
+
+                # get adjustment connections
+                connections = cmds.listConnections(
+                    "{0}.outAdjustments".format(renderlayer),
+                    d=0,
+                    c=1,
+                    p=1
+                ) or []
+
+                # iterate adjustment connections
+                connectionsIter = iter(connections)
+
+                # loop connections
+                for adjPlug in connectionsIter:
+                    adjValue = adjPlug.replace("outPlug", "outValue")
+                    scnPlug = connectionsIter.next()
+
+                    dsgPlugs = cmds.connectionInfo(adjValue, dfs=True)
+                    if not dsgPlugs:
+                        continue
+
+                    SG = dsgPlugs[0].split(".")[0]
+                    if sgOverrides:
+                        SG = sgOverrides[0]
+
+                    if SG not in shadingEngines:
+                        continue
+
+                    scnPlugParent = ""
+                    scnParentDstPlugs = []
+
+                    scnPlug = cmds.connectionInfo(scnPlug, ges=True)
+                    scnDstPlugs = cmds.connectionInfo(scnPlug, dfs=True)
+
+                    if "objectGroups" in scnPlug:
+                        scnPlugParent = scnPlug.rsplit(".", 1)[0]
+                        if scnPlugParent not in destinations:
+                            destinations[scnPlugParent] = cmds.connectionInfo(
+                                scnPlugParent,
+                                dfs=True
+                            ) or []
+
+                        scnParentDstPlugs = destinations[scnPlugParent]
+
+                    # find error in destination plugs
+                    isFinished = False
+                    for scnDstPlug in scnDstPlugs:
+                        node = scnDstPlug.split(".")[0]
+                        if node in shadingEngines:
+                            if SG != node:
+                                yield [
+                                    adjValue,
+                                    dagSetMembers(node),
+                                    adjValue,
+                                    dsgPlugs[0]
+                                ]
+
+                            isFinished = True
+                            break
 
-                        isFinished = True
-                        break
+                    # if finished continue to next
+                    if isFinished:
+                        continue
 
-                # if finished continue to next
-                if isFinished:
-                    continue
+                    # find error in parent destination plugs
+                    for scnParentDstPlug in scnParentDstPlugs:
+                        node = scnParentDstPlug.split(".")[0]
+                        if node in shadingEngines:
+                            if SG != node:
+                                yield [
+                                    adjValue,
+                                    dagSetMembers(node),
+                                    adjValue,
+                                    dsgPlugs[0]
+                                ]
 
-                # find error in parent destination plugs
-                for scnParentDstPlug in scnParentDstPlugs:
-                    node = scnParentDstPlug.split(".")[0]
-                    if cmds.nodeType(node) == "shadingEngine":
-                        if SG != node:
                             yield [
-                                adjValue,
-                                "{0}.dagSetMembers".format(node),
-                                adjValue,
-                                dsgPlugs[0]
+                                scnPlug,
+                                dagSetMembers(node),
+                                scnPlugParent,
+                                scnParentDstPlug
                             ]
-
-                        yield [
-                            scnPlug,
-                            "{0}.dagSetMembers".format(node),
-                            scnPlugParent,
-                            scnParentDstPlug
-                        ]
-
-        cmds.editRenderLayerGlobals(currentRenderLayer=currentlayer)
+        finally:
+            # restore current renderlayer
+            cmds.editRenderLayerGlobals(currentRenderLayer=currentlayer)
 
     def _fix(self, data):
         """
@@ -1,5 +1,58 @@
-from maya import cmds
-from ..utils import QualityAssurance
+from maya import cmds, OpenMaya
+from ..utils import QualityAssurance, api, cache
+
+
+ATTRIBUTES = [
+    "primaryVisibility",
+    "visibleInRefractions",
+    "visibleInReflections",
+    "castsShadows",
+    "receiveShadows",
+    "smoothShading",
+    "doubleSided",
+    "opposite"
+]
+
+
+def getRenderStat(meshes, attribute):
+    """
+    Get the value of a render stat of the provided meshes.
+
+    :param list meshes:
+    :param str attribute:
+    :return: Render stat value per mesh
+    :rtype: dict
+    """
+    stats = {}
+    for mesh, obj in zip(meshes, api.toMObjects(meshes)):
+        depNode = OpenMaya.MFnDependencyNode(obj)
+        stats[mesh] = depNode.findPlug(attribute, False).asBool()
+
+    return stats
+
+
+@cache.memoize
+def getRenderStats(meshes):
+    """
+    Get the values of all render stats of the provided meshes. All render
+    stats are read in a single pass over the meshes, when ran within a
+    CacheContext the render stat checks share this result.
+
+    :param list meshes:
+    :return: Render stat value per mesh per attribute
+    :rtype: dict
+    """
+    stats = dict((attribute, {}) for attribute in ATTRIBUTES)
+    for mesh, obj in zip(meshes, api.toMObjects(meshes)):
+        depNode = OpenMaya.MFnDependencyNode(obj)
+        for attribute in ATTRIBUTES:
+            value = depNode.findPlug(attribute, False).asBool()
+            stats[attribute][mesh] = value
+
+    return stats
+
+
+# ----------------------------------------------------------------------------
 
 
 class PrimaryVisibility(QualityAssurance):
@@ -36,9 +89,17 @@ class PrimaryVisibility(QualityAssurance):
         :rtype: generator
         """
         meshes = self.ls(type="mesh")
+        attribute = self.attribute.lstrip(".")
+
+        # the known render stats are shared between the checks, other
+        # attributes are read directly
+        if attribute in ATTRIBUTES:
+            stats = getRenderStats(meshes)[attribute]
+        else:
+            stats = getRenderStat(meshes, attribute)
 
         for mesh in meshes:
-            if cmds.getAttr(mesh + self.attribute) == self.errorBool:
+            if stats[mesh] == self.errorBool:
                 yield mesh
 
     def _fix(self, mesh):
@@ -1,4 +1,4 @@
-from maya import cmds
+from maya import cmds, OpenMaya
 from ..utils import QualityAssurance, reference
 
 
@@ -38,13 +38,25 @@ class DeleteNonDeformerHistory(QualityAssurance):
         :rtype: generator
         """
         meshes = self.ls(type="mesh")
-        meshes = reference.removeReferenced(meshes)
+        meshes = list(reference.removeReferenced(meshes))
 
-        for mesh in meshes:
-            history = cmds.listHistory(mesh)
-            deformers = cmds.ls(history, type=self.ignoreNodeTypes)
+        if not meshes:
+            return
+
+        # get the history of all meshes at once and filter it down to the
+        # nodes that are not ignored
+        history = cmds.listHistory(meshes) or []
+        deformers = cmds.ls(history, type=self.ignoreNodeTypes) or []
+        nonDeformers = set(history) - set(deformers)
+
+        if not nonDeformers:
+            return
 
-            if len(history) != len(deformers):
+        # the history is still queried per mesh to find out which meshes
+        # contain the non-deformer nodes
+        for mesh in meshes:
+            history = cmds.listHistory(mesh) or []
+            if not nonDeformers.isdisjoint(history):
                 yield mesh
 
     def _fix(self, mesh):
@@ -75,12 +87,23 @@ class DeleteNonSetDrivenAnimation(QualityAssurance):
         :return: Non set driven key animation curves
         :rtype: generator
         """
-        animCurves = self.ls(type="animCurve")
-        animCurves = reference.removeReferenced(animCurves)
-
-        for animCurve in animCurves:
-            if not cmds.listConnections("{0}.input".format(animCurve)):
-                yield animCurve
+        obj = OpenMaya.MObject()
+        iterator = self.lsApi(nodeType=OpenMaya.MFn.kAnimCurve)
+        while not iterator.isDone():
+            iterator.getDependNode(obj)
+            iterator.next()
+
+            # filter referenced animation curves
+            depNode = OpenMaya.MFnDependencyNode(obj)
+            if depNode.isFromReferencedFile():
+                continue
+
+            # check if the input plug is connected
+            if depNode.findPlug("input", False).isConnected():
+                continue
+
+            # yield error
+            yield depNode.name()
 
     def _fix(self, animCurve):
         """
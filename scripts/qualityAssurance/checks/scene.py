@@ -1,7 +1,6 @@
 import re
-import string
 from maya import cmds, OpenMaya
-from ..utils import QualityAssurance, reference, path
+from ..utils import QualityAssurance, api, reference, path
 
 
 class DefaultName(QualityAssurance):
@@ -30,19 +29,17 @@ class DefaultName(QualityAssurance):
             "Char"
         ]
 
-        self._regex = re.compile(
-            "".join(["^(?:", "|".join(default), ")"])
-        )
+        self._prefixes = tuple(default)
 
     # ------------------------------------------------------------------------
 
     @property
-    def regex(self):
+    def prefixes(self):
         """
-        :return: Regex to find default names
-        :rtype: _sre.SRE_Pattern
+        :return: Prefixes of default names
+        :rtype: tuple
         """
-        return self._regex
+        return self._prefixes
 
     # ------------------------------------------------------------------------
 
@@ -55,8 +52,7 @@ class DefaultName(QualityAssurance):
         transforms = reference.removeReferenced(transforms)
 
         for transform in transforms:
-            match = self.regex.match(transform)
-            if not match:
+            if not transform.startswith(self.prefixes):
                 continue
 
             # yield error
@@ -81,6 +77,16 @@ class NamingConvention(QualityAssurance):
 
         self._nodeTypes = ["transform", "joint"]
 
+        # sections start at a run of upper case characters or digits
+        self._sectionExpression = re.compile(
+            "[A-Z]+[^A-Z0-9]*|[0-9]+[^A-Z0-9]*|[^A-Z0-9]+"
+        )
+
+        # names that already follow the naming convention
+        self._validExpression = re.compile(
+            "^[a-z]+(?:_(?:[a-z]+|[0-9]+[a-z]*))*$"
+        )
+
     # ------------------------------------------------------------------------
 
     @property
@@ -93,58 +99,6 @@ class NamingConvention(QualityAssurance):
 
     # ------------------------------------------------------------------------
 
-    def splitOnCamelCase(self, n):
-        """
-        :param str n:
-        :return: If n is upper case
-        :rtype: bool
-        """
-        if n in string.ascii_uppercase:
-            return True
-
-    def splitOnDigit(self, n):
-        """
-        :param str n:
-        :return: If n is a digit
-        :rtype: bool
-        """
-        if n.isdigit():
-            return True
-
-    def splitOn(self, split, func):
-        """
-        :param list split: List of strings to split
-        :param func: Function to split string by
-        :return: Split sections
-        :rtype: list
-        """
-        sections = []
-        for s in split:
-            splitIndices = [
-                i for i, n in enumerate(s) if func(n)
-            ]
-            splitIndices = [
-                i for i in splitIndices if not (i-1 in splitIndices)
-            ]
-
-            if 0 not in splitIndices and splitIndices:
-                splitIndices.insert(0, 0)
-
-            if not splitIndices:
-                sections.append(s)
-                continue
-
-            splitIndices.append(-1)
-            for i in range(len(splitIndices) - 1):
-                if splitIndices[i+1] == -1:
-                    sections.append(s[splitIndices[i]:])
-                else:
-                    sections.append(s[splitIndices[i]:splitIndices[i+1]])
-
-        return sections
-
-    # ------------------------------------------------------------------------
-
     def convertToNamingConvention(self, name):
         """
         Convert string to naming convention.
@@ -160,8 +114,11 @@ class NamingConvention(QualityAssurance):
         sections = name.split("_")
         sections = [s[0].upper() + s[1:] for s in sections if s]
 
-        sections = self.splitOn(sections, self.splitOnCamelCase)
-        sections = self.splitOn(sections, self.splitOnDigit)
+        sections = [
+            section
+            for s in sections
+            for section in self._sectionExpression.findall(s)
+        ]
 
         # add delete on publish
         sections = [s.lower() for s in sections]
@@ -177,10 +134,16 @@ class NamingConvention(QualityAssurance):
         """
         nodes = self.ls(type=self.nodeTypes, l=True)
         nodes = reference.removeReferenced(nodes)
-        nodes = sorted(nodes, key=lambda x: -len(x.split("|")))
+        nodes = sorted(nodes, key=lambda x: -x.count("|"))
 
         for node in nodes:
-            if path.baseName(node) == self.convertToNamingConvention(node):
+            name = path.baseName(node)
+
+            # skip the conversion for names that are valid
+            if self._validExpression.match(name):
+                continue
+
+            if name == self.convertToNamingConvention(name):
                 continue
 
             # yield error
@@ -233,12 +196,21 @@ class UniqueName(QualityAssurance):
         # get root name
         root = path.rootName(node)
 
+        # get suffixes already in use
+        expression = re.compile("{0}_([0-9]{{3}})$".format(re.escape(root)))
+        used = set()
+        for existing in cmds.ls("{0}_*".format(root)) or []:
+            match = expression.match(path.rootName(existing))
+            if match:
+                used.add(int(match.group(1)))
+
         # find new name
         for i in range(1, 1000):
-            new = "{0}_{1:03d}".format(root, i)
-            if not cmds.ls(new):
+            if i not in used:
                 break
 
+        new = "{0}_{1:03d}".format(root, i)
+
         # rename node
         cmds.rename(node, new)
 
@@ -300,10 +272,10 @@ class NotConnectedIntermediateShape(QualityAssurance):
         :rtype: generator
         """
         intermediates = self.ls(shapes=True, intermediateObjects=True)
-        intermediates = reference.removeReferenced(intermediates)
+        intermediates = list(reference.removeReferenced(intermediates))
 
-        for intermediate in intermediates:
-            if cmds.listConnections(intermediate):
+        for intermediate, obj in zip(intermediates, api.toMObjects(intermediates)):
+            if api.hasConnections(obj):
                 continue
 
             yield intermediate
@@ -336,10 +308,10 @@ class NotConnectedGroupID(QualityAssurance):
         :rtype: generator
         """
         groupIds = self.ls(type="groupId")
-        groupIds = reference.removeReferenced(groupIds)
+        groupIds = list(reference.removeReferenced(groupIds))
 
-        for groupId in groupIds:
-            if cmds.listConnections(groupId):
+        for groupId, obj in zip(groupIds, api.toMObjects(groupIds)):
+            if api.hasConnections(obj):
                 continue
 
             yield groupId
@@ -427,7 +399,7 @@ class HyperBookmarks(QualityAssurance):
             pass
         finally:
             # reset connections locked state
-            for node, state in hyperPositionStored.iteritems():
+            for node, state in hyperPositionStored.items():
                 cmds.lockNode(node, lock=state)
 
 
@@ -451,45 +423,67 @@ class EmptyTransform(QualityAssurance):
         :return: Empty transforms
         :rtype: generator
         """
-        errors = []
-
         transforms = self.ls(transforms=True, l=True)
-        transforms = reference.removeReferenced(transforms)
-        transforms = sorted(transforms)
-        transforms.reverse()
+        transforms = set(reference.removeReferenced(transforms))
 
-        for transform in transforms:
-            appendToError = False
+        if not transforms:
+            return
+
+        # get dag paths in depth first order, processing them in reverse
+        # makes sure all children are processed before their parent
+        dagPaths = []
+        iterator = OpenMaya.MItDag(
+            OpenMaya.MItDag.kDepthFirst,
+            OpenMaya.MFn.kTransform
+        )
+        while not iterator.isDone():
+            dagPath = OpenMaya.MDagPath()
+            iterator.getPath(dagPath)
+            dagPaths.append(dagPath)
+
+            iterator.next()
+
+        # store the number of empty children per parent
+        emptyChildren = {}
 
-            # remove existing empty children
-            children = cmds.listRelatives(transform, c=True, f=True) or []
-            for c in children:
-                if c in errors:
-                    children.remove(c)
+        plugs = OpenMaya.MPlugArray()
+        connected = OpenMaya.MPlugArray()
+
+        for dagPath in reversed(dagPaths):
+            transform = dagPath.fullPathName()
+            if transform not in transforms:
+                continue
 
-            # continue of transform has children
-            if len(children) != 0:
+            # continue if transform has children that are not empty
+            if dagPath.childCount() != emptyChildren.get(transform, 0):
                 continue
 
             # continue if transform is not a transform ( maya bug )
-            if cmds.nodeType(transform) != "transform":
+            if dagPath.apiType() != OpenMaya.MFn.kTransform:
+                continue
+
+            # get connected nodes
+            connections = []
+            OpenMaya.MFnDependencyNode(dagPath.node()).getConnections(plugs)
+            for i in range(plugs.length()):
+                plugs[i].connectedTo(connected, True, True)
+                for j in range(connected.length()):
+                    connections.append(connected[j].node())
+
+            # continue if transform has connections other than a single
+            # connection to a display or render layer
+            if len(connections) > 1:
+                continue
+            elif len(connections) == 1 \
+                    and not connections[0].hasFn(OpenMaya.MFn.kDisplayLayer) \
+                    and not connections[0].hasFn(OpenMaya.MFn.kRenderLayer):
                 continue
 
-            # append to error list conditions
-            connection = cmds.listConnections(transform) or []
-            if len(connection) == 0:
-                appendToError = True
-            elif len(connection) == 1 \
-                    and cmds.nodeType(connection[0]) == "displayLayer":
-                appendToError = True
-            elif len(connection) == 1 \
-                    and cmds.nodeType(connection[0]) == "renderLayer":
-                appendToError = True
-
-            # append to error list
-            if appendToError:
-                errors.append(transform)
-                yield transform
+            # mark parent
+            parent = transform.rsplit("|", 1)[0]
+            emptyChildren[parent] = emptyChildren.get(parent, 0) + 1
+
+            yield transform
 
     def _fix(self, transform):
         """
@@ -556,13 +550,15 @@ class EmptyRenderLayer(QualityAssurance):
         :rtype: generator
         """
         layers = self.ls(type="renderLayer")
-        layers = reference.removeReferenced(layers)
+        layers = list(reference.removeReferenced(layers))
 
-        for layer in layers:
-            if (
-                not cmds.editRenderLayerMembers(layer, query=True)
-                and not cmds.getAttr("{0}.global".format(layer))
-            ):
+        for layer, obj in zip(layers, api.toMObjects(layers)):
+            # global layers contain all objects
+            depNode = OpenMaya.MFnDependencyNode(obj)
+            if depNode.findPlug("global", False).asBool():
+                continue
+
+            if not cmds.editRenderLayerMembers(layer, query=True):
                 yield layer
 
     def _fix(self, layer):
@@ -655,13 +651,23 @@ class EmptyNamespaces(QualityAssurance):
         namespaces = cmds.namespaceInfo(":", listOnlyNamespaces=True, recurse=True)
         namespaces.reverse()
 
+        # get namespaces that contain dependency nodes in a single pass
+        used = set()
+        iterator = OpenMaya.MItDependencyNodes()
+        while not iterator.isDone():
+            name = OpenMaya.MFnDependencyNode(iterator.thisNode()).name()
+            if ":" in name:
+                used.add(name.rsplit(":", 1)[0])
+
+            iterator.next()
+
         # loop namespaces
         for ns in namespaces:
             if ns in self.ignoreNamespaces:
                 continue
 
             # yield empty namespaces
-            if not cmds.namespaceInfo(ns, listOnlyDependencyNodes=True):
+            if ns not in used:
                 yield ns
 
     def _fix(self, namespace):
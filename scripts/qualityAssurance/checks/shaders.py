@@ -22,11 +22,28 @@ class NoShadingGroup(QualityAssurance):
         :rtype: generator
         """
         meshes = self.ls(type="mesh", noIntermediate=True, l=True)
-        meshes = reference.removeReferenced(meshes)
+        meshes = list(reference.removeReferenced(meshes))
+
+        if not meshes:
+            return
+
+        # get the shading group connections of all meshes at once
+        connections = cmds.listConnections(
+            meshes,
+            type="shadingEngine",
+            connections=True
+        ) or []
+
+        # get the long names of the connected meshes
+        connected = set(
+            cmds.ls(
+                [plug.split(".")[0] for plug in connections[::2]],
+                l=True
+            )
+        )
 
         for mesh in meshes:
-            shadingGroups = cmds.listConnections(mesh, type="shadingEngine")
-            if not shadingGroups:
+            if mesh not in connected:
                 yield mesh
 
 
@@ -113,26 +130,29 @@ class FaceAssignedShading(QualityAssurance):
         if not components:
             return
 
+        shapes = dict()
         overview = dict()
         components = cmds.ls(components, fl=True, l=True)
 
         # collect faces per object
         for face in components:
             obj = face.split(".")[0]
-            if cmds.nodeType(obj) == "transform":
-                shape = cmds.listRelatives(obj, s=True, ni=True, f=True)[0]
-            else:
-                shape = obj[:]
-
-            if not shape in overview.keys():
-                overview[shape] = []
-
-            overview[shape].append(face)
-
-        # loop overview
-        for shape, remove in overview.iteritems():
+            if obj not in shapes:
+                if cmds.nodeType(obj) == "transform":
+                    shapes[obj] = cmds.listRelatives(
+                        obj, s=True, ni=True, f=True
+                    )[0]
+                else:
+                    shapes[obj] = obj
+
+            overview.setdefault(shapes[obj], []).append(face)
+
+        # validate all shapes before editing the shading group
+        for shape, remove in overview.items():
             if len(remove) != cmds.polyEvaluate(shape, face=True):
                 raise RuntimeError("Incomplete Face Assigment")
 
-            cmds.sets(remove, edit=True, remove=shadingGroup)
-            cmds.sets(shape, edit=True, forceElement=shadingGroup)
+        # replace component assignments with shape assignments
+        remove = [face for faces in overview.values() for face in faces]
+        cmds.sets(remove, edit=True, remove=shadingGroup)
+        cmds.sets(list(overview.keys()), edit=True, forceElement=shadingGroup)
@@ -1,4 +1,6 @@
-from maya import cmds, OpenMaya, OpenMayaAnim
+from maya import cmds
+from maya.api import OpenMaya as OpenMaya2
+from maya.api import OpenMayaAnim as OpenMayaAnim2
 from ..utils import QualityAssurance, reference, skin, api
 
 
@@ -17,6 +19,41 @@ class UnusedInfluences(QualityAssurance):
         self._categories = ["Skinning"]
         self._selectable = True
 
+        self._unused = {}
+
+    # ------------------------------------------------------------------------
+
+    def getWeightedInfluences(self, skinCluster):
+        """
+        :param str skinCluster:
+        :return: Influences of the skin cluster that are weighted
+        :rtype: set
+        """
+        weighted = cmds.skinCluster(
+            skinCluster,
+            query=True,
+            weightedInfluence=True
+        ) or []
+        return set(weighted)
+
+    def getUnusedInfluences(self, skinCluster):
+        """
+        :param str skinCluster:
+        :return: Influences of the skin cluster that are not weighted
+        :rtype: list
+        """
+        weighted = self.getWeightedInfluences(skinCluster)
+
+        # get influences from the skin cluster directly, the names match the
+        # partial path names returned by the skinCluster command
+        skinFn = OpenMayaAnim2.MFnSkinCluster(api.toMObject2(skinCluster))
+        influences = [
+            infDag.partialPathName()
+            for infDag in skinFn.influenceObjects()
+        ]
+
+        return [i for i in influences if i not in weighted]
+
     # ------------------------------------------------------------------------
 
     def _find(self):
@@ -27,48 +64,38 @@ class UnusedInfluences(QualityAssurance):
         skinClusters = self.ls(type="skinCluster")
         skinClusters = reference.removeReferenced(skinClusters)
 
+        # reset unused influences stored in previous runs
+        self._unused = {}
+
         for skinCluster in skinClusters:
             mesh = cmds.skinCluster(skinCluster, query=True, geometry=True)
             if not mesh:
                 continue
-                
-            weighted = cmds.skinCluster(
-                skinCluster, 
-                query=True, 
-                weightedInfluence=True 
-            )
-            influences = cmds.skinCluster(
-                skinCluster, 
-                query=True, 
-                influence=True
-            )
-            
-            for i in influences:
-                if i not in weighted:
-                    yield skinCluster
-                    break
+
+            unused = self.getUnusedInfluences(skinCluster)
+            if unused:
+                # store unused influences so they can be reused when fixing
+                self._unused[skinCluster] = unused
+                yield skinCluster
 
     def _fix(self, skinCluster):
         """
         :param str skinCluster:
         """
-        weighted = cmds.skinCluster(
-                skinCluster, 
-                query=True, 
-                weightedInfluence=True 
-        )
-        
-        influences = cmds.skinCluster(
-            skinCluster, 
-            query=True, 
-            influence=True
-        )
-        
-        for i in influences:
-            if i not in weighted:
-                cmds.skinCluster(skinCluster, edit=True, removeInfluence=i)
+        unused = self._unused.pop(skinCluster, None)
+        if unused is None:
+            unused = self.getUnusedInfluences(skinCluster)
+        else:
+            # the weights could have been edited since finding, only remove
+            # the stored influences that are still not weighted
+            weighted = self.getWeightedInfluences(skinCluster)
+            unused = [i for i in unused if i not in weighted]
+
+        # remove all unused influences at once
+        if unused:
+            cmds.skinCluster(skinCluster, edit=True, removeInfluence=unused)
+
 
-                
 class MaximumInfluences(QualityAssurance):
     """
     Skin clusters will be checked to see if they contain vertices that exceed
@@ -85,6 +112,8 @@ class MaximumInfluences(QualityAssurance):
         self._categories = ["Skinning"]
         self._selectable = True
 
+        self._handles = {}
+
     # ------------------------------------------------------------------------
 
     def _find(self):
@@ -92,20 +121,11 @@ class MaximumInfluences(QualityAssurance):
         :return: Skin clusters which exceed maximum influences.
         :rtype: generator
         """
-        # variables
-        obj = OpenMaya.MObject()
+        # reset handles stored in previous runs
+        self._handles = {}
 
-        # get skin cluster iterator
-        iterator = self.lsApi(nodeType=OpenMaya.MFn.kSkinClusterFilter)
-        
         # iterate skin cluster
-        while not iterator.isDone():
-            # variables
-            iterator.getDependNode(obj)
-            depNode = OpenMaya.MFnDependencyNode(obj)
-            skinFn = OpenMayaAnim.MFnSkinCluster(obj)
-            skinCluster = depNode.name()
-            
+        for skinCluster in self.ls(type="skinCluster"):
             # skin cluster data
             maintain = "{0}.maintainMaxInfluences".format(skinCluster)
             maintain = cmds.getAttr(maintain)
@@ -114,26 +134,35 @@ class MaximumInfluences(QualityAssurance):
 
             # skip if max influences doesn't have to be maintained
             if not maintain:
-                iterator.next()
                 continue
-            
+
+            # variables
+            obj = api.toMObject2(skinCluster)
+            skinFn = OpenMayaAnim2.MFnSkinCluster(obj)
+
             # get influences
             infIds, infPaths = skin.getInfluencesApi(skinFn)
             
             # get weights
             for weight in skin.getWeightsApiGenerator(skinFn, infIds):
-                if len([w for w in weight.values() if w]) > maxInfluences:
+                if sum(1 for w in weight.values() if w) > maxInfluences:
+                    # store handle so the skin cluster doesn't have to be
+                    # looked up by name when fixing
+                    self._handles[skinCluster] = OpenMaya2.MObjectHandle(obj)
                     yield skinCluster
                     break
-
-            iterator.next()
      
     def _fix(self, skinCluster):
         """
         :param str skinCluster:
         """
-        obj = api.toMObject(skinCluster)
-        skinFn = OpenMayaAnim.MFnSkinCluster(obj)
+        handle = self._handles.pop(skinCluster, None)
+        if handle and handle.isValid():
+            obj = handle.object()
+        else:
+            obj = api.toMObject2(skinCluster)
+
+        skinFn = OpenMayaAnim2.MFnSkinCluster(obj)
         
         # normalize
         normalizePath = "{0}.normalizeWeights".format(skinCluster)
@@ -147,34 +176,34 @@ class MaximumInfluences(QualityAssurance):
         infIds, infPaths = skin.getInfluencesApi(skinFn)
         infIdsLocked = {
             i: cmds.getAttr("{0}.liw".format(infPaths[i]))
-            for _, i in infIds.iteritems()
+            for _, i in infIds.items()
         }
-        
+
+        # map the influence indices used in the weights to the logical
+        # indices of the weights attribute
+        infIdsLogical = {i: infId for infId, i in infIds.items()}
+
         # get weights
         weights = skin.getWeightsApi(skinFn, infIds)
 
-        for vId, vWeights in weights.iteritems():
+        changes = []
+        for vId, vWeights in weights.items():
+            # skip vertices that don't exceed the maximum influences
+            if sum(1 for w in vWeights.values() if w) <= maxInfluences:
+                continue
+
             # variable
             nWeights = vWeights.copy()
-        
-            # sort weights
-            ordered = sorted(vWeights.items(), key=lambda x: -x[1])
-        
-            keepIndices = [
-                index 
-                for i, (index, weight) in enumerate(ordered) 
-                if i <= maxInfluences-1
-            ]
-            removeIndices = [
-                index 
-                for i, (index, weight) in enumerate(ordered) 
-                if i > maxInfluences-1
-            ]
-            
+
+            # sort influences by weight and split them
+            ordered = sorted(vWeights, key=vWeights.get, reverse=True)
+            keepIndices = ordered[:maxInfluences]
+            removeIndices = ordered[maxInfluences:]
+
             # remove weights
             for i in removeIndices:
                 nWeights[i] = 0
-            
+
             # normalize weights
             if normalize == 1:
                 # get normalizable weights
@@ -183,24 +212,33 @@ class MaximumInfluences(QualityAssurance):
                     for i in keepIndices
                     if not infIdsLocked.get(i)
                 ]
-                
+
                 # if no weights can be normalized, normalize all
                 if not normalizeIndices:
                     normalizeIndices = keepIndices
-                
+
                 # get normalizing multiplier
-                total = sum([vWeights.get(i) for i in normalizeIndices])
+                total = sum(vWeights[i] for i in normalizeIndices)
                 multiplier = 1/total
-                
+
                 # normalize indices
                 for i in normalizeIndices:
-                    nWeights[i] = vWeights.get(i) * multiplier       
-            
-            # set weights
-            for infId, infValue in nWeights.items():
+                    nWeights[i] = vWeights.get(i) * multiplier
+
+            # store weights that have changed
+            for i, infValue in nWeights.items():
+                if infValue == vWeights.get(i):
+                    continue
+
                 infAttr = "{0}.weightList[{1}].weights[{2}]".format(
                     skinCluster,
                     vId,
-                    infId
+                    infIdsLogical[i]
                 )
+                changes.append((infAttr, infValue))
+
+        # set weights, the skin cluster is prevented from normalizing the
+        # weights after every change
+        with skin.DisableNormalizeContext(skinCluster):
+            for infAttr, infValue in changes:
                 cmds.setAttr(infAttr, infValue)
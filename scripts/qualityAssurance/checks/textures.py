@@ -1,6 +1,5 @@
-import os
 from maya import cmds
-from ..utils import QualityAssurance, reference
+from ..utils import QualityAssurance, path, reference
 
 
 class NonExistingTextures(QualityAssurance):
@@ -26,8 +25,8 @@ class NonExistingTextures(QualityAssurance):
         """
         fileNodes = self.ls(type="file")
         for fileNode in fileNodes:
-            path = cmds.getAttr("{0}.fileTextureName".format(fileNode))
-            if not os.path.exists(path):
+            filePath = cmds.getAttr("{0}.fileTextureName".format(fileNode))
+            if not path.exists(filePath):
                 yield fileNode
 
     def _fix(self, fileNode):
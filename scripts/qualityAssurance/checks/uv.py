@@ -1,5 +1,6 @@
 from maya import cmds
-from ..utils import QualityAssurance, reference
+from maya.api import OpenMaya as OpenMaya2
+from ..utils import QualityAssurance, mesh
 
 
 class EmptyUVSets(QualityAssurance):
@@ -22,19 +23,30 @@ class EmptyUVSets(QualityAssurance):
         :return: Empty UV Sets
         :rtype: generator
         """
-        meshes = cmds.ls(type="mesh", noIntermediate=True, l=True)
-        meshes = reference.removeReferenced(meshes)
+        uvSetName = "{0}.uvSet[{1}].uvSetName".format
+        getUVSetNamePlugs = mesh.getUVSetNamePlugs
 
-        for mesh in meshes:
-            uvSets = cmds.polyUVSet(mesh, query=True, allUVSets=True)
-            uvSetsIndex = cmds.polyUVSet(mesh, query=True, allUVSetsIndices=True)
+        for dagPath in self.lsDagPaths(OpenMaya2.MFn.kMesh):
+            meshFn = OpenMaya2.MFnMesh(dagPath)
 
-            for uvSet, index in zip(uvSets, uvSetsIndex):
-                if index == 0:
+            # ignore intermediate and referenced meshes
+            if meshFn.isIntermediateObject or meshFn.isFromReferencedFile:
+                continue
+
+            path = dagPath.fullPathName()
+            for index, plug in getUVSetNamePlugs(dagPath):
+                name = plug.asString()
+                if index == 0 or not name:
+                    continue
+
+                # stale uv set entries can't be evaluated
+                try:
+                    numUVs = meshFn.numUVs(name)
+                except RuntimeError:
                     continue
 
-                if not cmds.polyEvaluate(mesh, uvcoord=True, uvSetName=uvSet):
-                    yield "{0}.uvSet[{1}].uvSetName".format(mesh, index)
+                if not numUVs:
+                    yield uvSetName(path, index)
 
     def _fix(self, meshAttribute):
         """
@@ -59,9 +71,9 @@ class UnusedUVSets(QualityAssurance):
         self._categories = ["UV"]
         self._selectable = False
 
-        self._ignoreUvSets = [
+        self._ignoreUvSets = frozenset([
             "hairUVSet",
-        ]
+        ])
 
     # ------------------------------------------------------------------------
 
@@ -76,20 +88,25 @@ class UnusedUVSets(QualityAssurance):
         :return: Empty UV Sets
         :rtype: generator
         """
-        meshes = cmds.ls(type="mesh", noIntermediate=True, l=True)
-        meshes = reference.removeReferenced(meshes)
+        ignoreUvSets = self.ignoreUvSets
+        uvSetName = "{0}.uvSet[{1}].uvSetName".format
+        getUVSetNamePlugs = mesh.getUVSetNamePlugs
+
+        for dagPath in self.lsDagPaths(OpenMaya2.MFn.kMesh):
+            meshFn = OpenMaya2.MFnMesh(dagPath)
 
-        for mesh in meshes:
-            uvSets = cmds.polyUVSet(mesh, query=True, allUVSets=True)
-            uvSetsIndex = cmds.polyUVSet(mesh, query=True, allUVSetsIndices=True)
+            # ignore intermediate and referenced meshes
+            if meshFn.isIntermediateObject or meshFn.isFromReferencedFile:
+                continue
 
-            for uvSet, index in zip(uvSets, uvSetsIndex):
-                if index == 0 or uvSet in self.ignoreUvSets:
+            path = dagPath.fullPathName()
+            for index, plug in getUVSetNamePlugs(dagPath):
+                name = plug.asString()
+                if index == 0 or not name or name in ignoreUvSets:
                     continue
 
-                attr = "{0}.uvSet[{1}].uvSetName".format(mesh, index)
-                if not cmds.listConnections(attr):
-                    yield attr
+                if not plug.isConnected:
+                    yield uvSetName(path, index)
 
     def _fix(self, meshAttribute):
         """
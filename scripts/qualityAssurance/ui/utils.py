@@ -67,16 +67,43 @@ def mayaWindow():
 # ----------------------------------------------------------------------------
 
 
+ICON_PATHS = {}
+ICONS = {}
+
+
 def getIconPath(name):
     """
     Get an icon path based on file name. All paths in the XBMLANGPATH variable
-    processed to see if the provided icon can be found.
+    processed to see if the provided icon can be found. The path of each icon
+    is only searched for once.
 
     :param str name:
     :return: Icon path
     :rtype: str/None
     """
+    if name in ICON_PATHS:
+        return ICON_PATHS[name]
+
+    ICON_PATHS[name] = None
     for path in os.environ.get("XBMLANGPATH").split(os.pathsep):
         iconPath = os.path.join(path, name)
         if os.path.exists(iconPath):
-            return iconPath.replace("\\", "/")
+            ICON_PATHS[name] = iconPath.replace("\\", "/")
+            break
+
+    return ICON_PATHS[name]
+
+
+def getIcon(path):
+    """
+    Get an icon based on its path. Icons are only created once and shared
+    between all widgets that use the same path.
+
+    :param str path:
+    :return: Icon
+    :rtype: QIcon
+    """
+    if path not in ICONS:
+        ICONS[path] = QIcon(path)
+
+    return ICONS[path]
@@ -1,5 +1,6 @@
 from . import utils
 from .. import checks, collections
+from ..utils import cache, tool
 
 
 class CollectionsWidget(utils.QWidget):
@@ -73,7 +74,7 @@ class DropDownWidget(utils.QWidget):
         :param bool state:
         """
         self.icon.setIcon(
-            utils.QIcon(
+            utils.getIcon(
                 utils.COLLAPSE_ICONS.get(state)
             )
         )
@@ -150,7 +151,7 @@ class CheckWidget(utils.QWidget):
         self.urgency.setMinimumSize(16, 16)
         self.urgency.setMaximumSize(16, 16)
         self.urgency.setFlat(True)
-        self.urgency.setIcon(utils.QIcon(utils.CHECK_ICON))
+        self.urgency.setIcon(utils.getIcon(utils.CHECK_ICON))
         self.urgency.setToolTip(self.toolTipText)
         self.urgency.released.connect(self.doFind)
         layout.addWidget(self.urgency)
@@ -180,7 +181,7 @@ class CheckWidget(utils.QWidget):
         self.select.setMinimumSize(16, 16)
         self.select.setMaximumSize(16, 16)
         self.select.setFlat(True)
-        self.select.setIcon(utils.QIcon(utils.SELECT_ICON))
+        self.select.setIcon(utils.getIcon(utils.SELECT_ICON))
         self.select.setEnabled(False)
         self.select.released.connect(self.check.select)
         layout.addWidget(self.select)
@@ -190,7 +191,7 @@ class CheckWidget(utils.QWidget):
         self.fix.setMinimumSize(16, 16)
         self.fix.setMaximumSize(16, 16)
         self.fix.setFlat(True)
-        self.fix.setIcon(utils.QIcon(utils.getIconPath("QA_fix.png")))
+        self.fix.setIcon(utils.getIcon(utils.getIconPath("QA_fix.png")))
         self.fix.released.connect(self.doFix)
         self.fix.setEnabled(False)
         layout.addWidget(self.fix)
@@ -223,6 +224,10 @@ class CheckWidget(utils.QWidget):
         indicators will be set, status text changed, selectable and fix button
         enabled or disabled.
         """
+        # get check state
+        errors = bool(self.check.errors)
+        message = self.check.message
+
         # update urgency
         self.urgency.setIcon(utils.QIcon())
         self.urgency.setFlat(False)
@@ -231,19 +236,13 @@ class CheckWidget(utils.QWidget):
         )
 
         # update status
-        self.status.setText(
-            self.check.message if self.check.message else self.check.name
-        )
+        self.status.setText(message if message else self.check.name)
 
         # update selectable
-        self.select.setEnabled(False)
-        if self.check.errors and self.check.isSelectable():
-            self.select.setEnabled(True)
+        self.select.setEnabled(errors and self.check.isSelectable())
 
         # update fixable
-        self.fix.setEnabled(False)
-        if self.check.errors and self.check.isFixable():
-            self.fix.setEnabled(True)
+        self.fix.setEnabled(errors and self.check.isFixable())
 
 
 class QualityAssuranceWidget(utils.QWidget):
@@ -310,24 +309,35 @@ class QualityAssuranceWidget(utils.QWidget):
     def doFindAll(self):
         """
         Loop over all widgets and see if the check button is enabled. If this
-        is the case the check function can be ran.
+        is the case the check function can be ran. Scene queries are shared
+        between the checks for the duration of the loop. The widget is only
+        repainted once all checks are ran.
         """
-        for widget in self.widgets:
-            if not widget.urgency.isEnabled():
-                continue
+        self.setUpdatesEnabled(False)
 
-            widget.doFind()
+        try:
+            widgets = [w for w in self.widgets if w.urgency.isEnabled()]
+            with cache.CacheContext(), tool.SelectToolContext():
+                for widget in widgets:
+                    widget.doFind()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def doFixAll(self):
         """
         Loop over all widgets and see if the fix button is enabled. If this
-        is the case the fix function can be ran.
+        is the case the fix function can be ran. The widget is only repainted
+        once all fixes are ran.
         """
-        for widget in self.widgets:
-            if not widget.fix.isEnabled():
-                continue
+        self.setUpdatesEnabled(False)
 
-            widget.doFix()
+        try:
+            widgets = [w for w in self.widgets if w.fix.isEnabled()]
+            with tool.SelectToolContext():
+                for widget in widgets:
+                    widget.doFix()
+        finally:
+            self.setUpdatesEnabled(True)
 
     # ------------------------------------------------------------------------
 
@@ -345,27 +355,35 @@ class QualityAssuranceWidget(utils.QWidget):
     def refresh(self, collection):
         """
         Clear the entire UI and populate it with the checks that are part of
-        the collection parsed in as an argument.
+        the collection parsed in as an argument. The widget is only repainted
+        once it is populated.
 
         :param str collection:
         """
-        # clear ui
-        self.clear()
-        self.widgets = []
-
-        # get checks
-        data = checks.getChecksFromCollection(collection)
-        number = 1
-        for categoryName, checkList in data.iteritems():
-            # create category
-            category = CategoryWidget(self, categoryName)
-            self.layout.insertWidget(self.layout.count()-1, category)
-
-            # create checks
-            for check in checkList:
-                widget = CheckWidget(self, check, number)
-                self.widgets.append(widget)
-
-                # add check to category
-                category.addWidget(widget)
-                number += 1
+        self.setUpdatesEnabled(False)
+
+        try:
+            # clear ui
+            self.clear()
+            self.widgets = []
+
+            # get checks
+            data = checks.getChecksFromCollection(collection)
+            number = 1
+            for categoryName, checkList in data.items():
+                # create category
+                category = CategoryWidget(self, categoryName)
+
+                # create checks
+                for check in checkList:
+                    widget = CheckWidget(self, check, number)
+                    self.widgets.append(widget)
+
+                    # add check to category
+                    category.addWidget(widget)
+                    number += 1
+
+                # add populated category
+                self.layout.insertWidget(self.layout.count()-1, category)
+        finally:
+            self.setUpdatesEnabled(True)
@@ -1,4 +1,5 @@
-from maya import cmds
+from maya import cmds, OpenMaya, OpenMayaAnim
+from . import cache, reference
 
 
 def removeDrivenAnimCurves(animCurves):
@@ -14,3 +15,65 @@ def removeDrivenAnimCurves(animCurves):
             continue
 
         yield animCurve
+
+
+@cache.memoize
+def filterAnimCurves(animCurves):
+    """
+    Remove referenced and set driven animation curves from the list. The
+    result is shared between checks that are ran within the same
+    cache.CacheContext.
+
+    :param list animCurves: List of strings
+    :return: Filtered list without referenced and set driven anim curves
+    :rtype: list
+    """
+    animCurves = reference.removeReferenced(animCurves)
+    animCurves = removeDrivenAnimCurves(animCurves)
+
+    return list(animCurves)
+
+
+def getKeyframeCounts(animCurves):
+    """
+    Get the number of keys of each of the animation curves. The animation
+    curves are resolved using a single selection list, this avoids calling
+    the keyframe command for every animation curve.
+
+    :param list animCurves: List of strings
+    :return: Number of keys per animation curve
+    :rtype: list
+    """
+    selectionList = OpenMaya.MSelectionList()
+    for animCurve in animCurves:
+        selectionList.add(animCurve)
+
+    counts = []
+    obj = OpenMaya.MObject()
+    for i in range(selectionList.length()):
+        selectionList.getDependNode(i, obj)
+        counts.append(OpenMayaAnim.MFnAnimCurve(obj).numKeys())
+
+    return counts
+
+
+def getLockedKeys(animCurve):
+    """
+    Get the locked key plugs of an animation curve. A single listAttr query
+    is used to only return the locked indices of the key time value array.
+
+    :param str animCurve:
+    :return: Locked key plugs
+    :rtype: list
+    """
+    attributes = cmds.listAttr(
+        "{0}.ktv".format(animCurve),
+        multi=True,
+        locked=True
+    ) or []
+
+    return [
+        "{0}.{1}".format(animCurve, attribute)
+        for attribute in attributes
+        if attribute.endswith("]")
+    ]
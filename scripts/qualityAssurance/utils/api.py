@@ -1,4 +1,5 @@
 from maya import cmds, OpenMaya
+from maya.api import OpenMaya as OpenMaya2
 
 
 def toMObject(node):
@@ -17,6 +18,100 @@ def toMObject(node):
     return obj
 
 
+def exists(node):
+    """
+    Check if a node exists by adding it to a OpenMaya.MSelectionList. This
+    avoids running the objExists command for every node.
+
+    :param str node:
+    :return: Exists state
+    :rtype: bool
+    """
+    try:
+        OpenMaya.MSelectionList().add(node)
+    except RuntimeError:
+        return False
+
+    return True
+
+
+def toMPlug(plug):
+    """
+    Convert a plug into a OpenMaya.MPlug.
+
+    :param str plug:
+    :return: MPlug of parsed plug
+    :rtype: OpenMaya.MPlug
+    """
+    selectionList = OpenMaya.MSelectionList()
+    selectionList.add(plug)
+    mPlug = OpenMaya.MPlug()
+    selectionList.getPlug(0, mPlug)
+
+    return mPlug
+
+
+def toMObjects(nodes):
+    """
+    Convert a list of nodes into a list of OpenMaya.MObject. A single
+    selection list is used to convert all of the nodes at once.
+
+    :param list nodes:
+    :return: MObjects of parsed nodes
+    :rtype: list
+    """
+    selectionList = OpenMaya.MSelectionList()
+    for node in nodes:
+        selectionList.add(node)
+
+    objs = []
+    for i in range(selectionList.length()):
+        obj = OpenMaya.MObject()
+        selectionList.getDependNode(i, obj)
+        objs.append(obj)
+
+    return objs
+
+
+def toNames(iterator):
+    """
+    Convert the nodes of a OpenMaya.MItSelectionList into a list of names.
+    Dag nodes are converted into their full path names.
+
+    :param OpenMaya.MItSelectionList iterator:
+    :return: Names of iterated nodes
+    :rtype: list
+    """
+    names = []
+
+    obj = OpenMaya.MObject()
+    while not iterator.isDone():
+        iterator.getDependNode(obj)
+
+        if obj.hasFn(OpenMaya.MFn.kDagNode):
+            names.append(OpenMaya.MDagPath.getAPathTo(obj).fullPathName())
+        else:
+            names.append(OpenMaya.MFnDependencyNode(obj).name())
+
+        iterator.next()
+
+    return names
+
+
+def hasConnections(obj):
+    """
+    Check if any of the plugs of the provided node are connected.
+
+    :param OpenMaya.MObject obj:
+    :return: Connected state
+    :rtype: bool
+    """
+    plugs = OpenMaya.MPlugArray()
+    OpenMaya.MFnDependencyNode(obj).getConnections(plugs)
+
+    return plugs.length() > 0
+
+
 def toMDagPath(node):
     """
     Convert a node into a OpenMaya.MDagPath.
@@ -29,3 +124,33 @@ def toMDagPath(node):
     if obj.hasFn(OpenMaya.MFn.kDagNode):
         dag = OpenMaya.MDagPath.getAPathTo(obj)
         return dag
+
+
+def toMObject2(node):
+    """
+    Convert a node into a maya.api.OpenMaya.MObject. This can be used to
+    bridge to the Python API 2.0, objects of both API's should not be mixed.
+
+    :param str node:
+    :return: MObject of parsed node
+    :rtype: maya.api.OpenMaya.MObject
+    """
+    selectionList = OpenMaya2.MSelectionList()
+    selectionList.add(node)
+
+    return selectionList.getDependNode(0)
+
+
+def toMDagPath2(node):
+    """
+    Convert a node into a maya.api.OpenMaya.MDagPath. This can be used to
+    bridge to the Python API 2.0, objects of both API's should not be mixed.
+
+    :param str node:
+    :return: MDagPath of parsed node
+    :rtype: maya.api.OpenMaya.MDagPath
+    """
+    selectionList = OpenMaya2.MSelectionList()
+    selectionList.add(node)
+
+    return selectionList.getDagPath(0)
@@ -0,0 +1,114 @@
+from functools import wraps
+from maya import cmds
+
+
+class CacheContext(object):
+    """
+    This context will store the return values of all functions decorated
+    with the memoize decorator that are ran within the context. Contexts can
+    be nested, the stored values are cleared once the outer most context is
+    exited. This makes it possible to share scene queries between quality
+    assurance checks that are ran together, without the risk of working with
+    outdated data in a next run.
+
+    .. code-block:: python
+
+        with CacheContext():
+            # code
+    """
+    depth = 0
+    cache = {}
+
+    def __enter__(self):
+        CacheContext.depth += 1
+
+    def __exit__(self, *exc_info):
+        CacheContext.depth -= 1
+
+        if not CacheContext.depth:
+            CacheContext.cache.clear()
+
+
+# ----------------------------------------------------------------------------
+
+
+def toKey(value):
+    """
+    Convert the value into something hashable so it can be used as a key in
+    the cache. Lists are converted into tuples.
+
+    :param value:
+    :return: Hashable value
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(toKey(v) for v in value)
+
+    return value
+
+
+def memoize(func):
+    """
+    Store the return value of the decorated function while a CacheContext is
+    active, the arguments are used as key. If no context is active the
+    function will be called as usual. Cached return values are shared between
+    callers and should not be mutated.
+
+    :param func:
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not CacheContext.depth:
+            return func(*args, **kwargs)
+
+        key = (
+            func,
+            toKey(args),
+            tuple(sorted((k, toKey(v)) for k, v in kwargs.items()))
+        )
+
+        if key not in CacheContext.cache:
+            CacheContext.cache[key] = func(*args, **kwargs)
+
+        return CacheContext.cache[key]
+    return wrapper
+
+
+def memoizeByKey(key):
+    """
+    Store the return value of the decorated function while a CacheContext is
+    active, the key function is called with the arguments of the decorated
+    function to get the key. This can be used when the arguments themselves
+    can't be used as key, like OpenMaya function sets. If no context is
+    active the function will be called as usual.
+
+    :param key:
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not CacheContext.depth:
+                return func(*args, **kwargs)
+
+            k = (func, key(*args, **kwargs))
+            if k not in CacheContext.cache:
+                CacheContext.cache[k] = func(*args, **kwargs)
+
+            return CacheContext.cache[k]
+        return wrapper
+    return decorator
+
+
+# ----------------------------------------------------------------------------
+
+
+@memoize
+def ls(*args, **kwargs):
+    """
+    Memoized version of Maya's ls command. Checks that are ran within the
+    same CacheContext share the scene queries with the same arguments. The
+    returned list should not be mutated.
+
+    :return: Object list
+    :rtype: list
+    """
+    return cmds.ls(*args, **kwargs) or []
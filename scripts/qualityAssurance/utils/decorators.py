@@ -10,7 +10,7 @@ def ifNoErrorsReturn(argument):
     def decorator(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            if not self.errors:
+            if not self._errors:
                 return argument
 
             return func(self, *args, **kwargs)
@@ -0,0 +1,81 @@
+import math
+import itertools
+from maya.api import OpenMaya as OpenMaya2
+
+
+def getCoincidentVertices(dagPath, tolerance=0.00001):
+    """
+    Get the indices of the vertices that lie within the tolerance of another
+    vertex of the same mesh. All points are retrieved in a single query and
+    bucketed in a grid whose cells are the size of the tolerance. Points
+    that lie within the tolerance of each other are in the same or in
+    adjacent cells, so only points of those cells are compared.
+
+    :param maya.api.OpenMaya.MDagPath dagPath:
+    :param float tolerance:
+    :return: Coincident vertex indices
+    :rtype: set
+    """
+    # get world space points
+    points = OpenMaya2.MFnMesh(dagPath).getPoints(OpenMaya2.MSpace.kWorld)
+
+    # bucket points
+    cells = {}
+    for i, point in enumerate(points):
+        x, y, z = point.x, point.y, point.z
+        key = (
+            int(math.floor(x / tolerance)),
+            int(math.floor(y / tolerance)),
+            int(math.floor(z / tolerance))
+        )
+        cells.setdefault(key, []).append((x, y, z, i))
+
+    # every pair of adjacent cells only has to be compared once, so only the
+    # adjacent cells that come after the cell are compared
+    offsets = [
+        offset
+        for offset in itertools.product((-1, 0, 1), repeat=3)
+        if offset > (0, 0, 0)
+    ]
+
+    vertices = set()
+    squared = tolerance * tolerance
+
+    def compare(pairs):
+        for (x0, y0, z0, i0), (x1, y1, z1, i1) in pairs:
+            dx, dy, dz = x1 - x0, y1 - y0, z1 - z0
+            if dx * dx + dy * dy + dz * dz < squared:
+                vertices.add(i0)
+                vertices.add(i1)
+
+    for (cx, cy, cz), cell in cells.items():
+        # compare points within the cell
+        if len(cell) > 1:
+            compare(itertools.combinations(cell, 2))
+
+        # compare points with the points of the adjacent cells
+        for ox, oy, oz in offsets:
+            other = cells.get((cx + ox, cy + oy, cz + oz))
+            if other:
+                compare(itertools.product(cell, other))
+
+    return vertices
+
+
+def getUVSetNamePlugs(dagPath):
+    """
+    Get the uv set name plugs of a mesh together with the logical index of
+    the uv set they belong to. The plugs are read directly from the uvSet
+    array attribute of the mesh.
+
+    :param maya.api.OpenMaya.MDagPath dagPath:
+    :return: Logical indices and uv set name plugs
+    :rtype: generator
+    """
+    depNode = OpenMaya2.MFnDependencyNode(dagPath.node())
+    uvSetPlug = depNode.findPlug("uvSet", False)
+    uvSetNameAttr = depNode.attribute("uvSetName")
+
+    for index in uvSetPlug.getExistingArrayAttributeIndices():
+        element = uvSetPlug.elementByLogicalIndex(index)
+        yield index, element.child(uvSetNameAttr)
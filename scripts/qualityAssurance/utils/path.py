@@ -1,3 +1,8 @@
+import os
+import itertools
+from . import cache
+
+
 def baseName(name):
     """
     This function will strip the namespaces and grouping information of a name.
@@ -37,6 +42,50 @@ def namespace(name):
 # ----------------------------------------------------------------------------
 
 
+@cache.memoize
+def getDirectoryContent(directory):
+    """
+    Get the names of all files and directories in a directory, the names are
+    normalized to the case of the file system. Directories that don't exist
+    or can't be read return an empty set. When ran within a CacheContext the
+    directory will only be read once.
+
+    :param str directory:
+    :return: Directory content
+    :rtype: set
+    """
+    try:
+        return set(
+            os.path.normcase(name)
+            for name in os.listdir(directory or os.curdir)
+        )
+    except (OSError, IOError):
+        return set()
+
+
+def exists(filePath):
+    """
+    Check if a file path exists by looking it up in the content of its
+    directory. This is faster than checking each file on disk when many files
+    share the same directory, especially on network drives. If the name is
+    not found in the content of the directory the file path is checked on
+    disk, the lookup can miss files on case insensitive file systems that
+    don't normalize the case.
+
+    :param str filePath:
+    :return: Exists state
+    :rtype: bool
+    """
+    directory, name = os.path.split(os.path.normcase(filePath))
+    if name and name in getDirectoryContent(directory):
+        return True
+
+    return os.path.exists(filePath)
+
+
+# ----------------------------------------------------------------------------
+
+
 def asFlatList(input):
     """
     Convert the input to a flat list.
@@ -45,22 +94,15 @@ def asFlatList(input):
     :return: Flattened list
     :rtype: list
     """
-    if type(input) != list:
+    if not isinstance(input, list):
         # return list with input as content
         return [input]
 
-    elif type(input) == list and type(input[0]) == list:
-        # if the first element of the list is also a list. loop over the lists
-        # within the lists, and extend them into a new list making the return
-        # value a combined list.
-        content = []
-        for i in input:
-            content.extend(i)
-        return content
-
-    elif type(input) == list:
-        # return input value
-        return input
-
-    # return empty list
-    return []
+    elif input and isinstance(input[0], list):
+        # if the first element of the list is also a list. chain the lists
+        # within the lists into a new list making the return value a
+        # combined list.
+        return list(itertools.chain.from_iterable(input))
+
+    # return input value
+    return input
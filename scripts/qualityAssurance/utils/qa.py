@@ -1,7 +1,8 @@
 import sys
 import traceback
-from maya import cmds, OpenMaya
-from . import decorators, undo, path
+from maya import OpenMaya
+from maya.api import OpenMaya as OpenMaya2
+from . import api, cache, decorators, refresh, tool, undo, path
 
 
 class QualityAssurance(object):
@@ -98,7 +99,7 @@ class QualityAssurance(object):
         :return: Findable state of quality assurance check
         :rtype: bool
         """
-        return True if "_find" in dir(self) else False
+        return hasattr(self, "_find")
 
     def find(self):
         """
@@ -114,12 +115,19 @@ class QualityAssurance(object):
         # reset errors list
         self._errors = []
 
-        # find errors
-        for error in self._find():
-            if error in self.errors:
-                continue
+        # find errors, the errors found are stored in a set as well to
+        # quickly filter duplicates. lists are stored as tuples to make them
+        # hashable.
+        found = set()
+        with cache.CacheContext(), refresh.RefreshContext(), \
+                tool.SelectToolContext():
+            for error in self._find():
+                key = cache.toKey(error)
+                if key in found:
+                    continue
 
-            self.errors.append(error)
+                found.add(key)
+                self._errors.append(error)
 
     # ------------------------------------------------------------------------
 
@@ -131,7 +139,7 @@ class QualityAssurance(object):
         :return: Fixable state of quality assurance check
         :rtype: bool
         """
-        return True if "_fix" in dir(self) else False
+        return hasattr(self, "_fix")
 
     def fix(self):
         """
@@ -148,14 +156,15 @@ class QualityAssurance(object):
             )
 
         # remove errors
-        with undo.UndoContext():
+        with undo.UndoContext(), refresh.RefreshContext(), \
+                tool.SelectToolContext():
             for error in self.errors[:]:
                 # remove objects that might have been deleted in other
                 # quality assurance checks.
 
                 if self.isSelectable() and (
                         type(error) in [str, unicode]
-                        and not cmds.objExists(error)
+                        and not api.exists(error)
                 ):
                     self._errors.remove(error)
                     continue
@@ -194,10 +203,21 @@ class QualityAssurance(object):
 
     def select(self):
         """
-        Select all current entries of the error list.
+        Select all current entries of the error list. The entries are added
+        to a selection list that replaces the active selection, entries that
+        no longer exist are skipped.
         """
-        if self.isSelectable() and self.errors:
-            cmds.select(path.asFlatList(self.errors))
+        if not self.isSelectable() or not self.errors:
+            return
+
+        selectionList = OpenMaya2.MSelectionList()
+        for error in path.asFlatList(self.errors):
+            try:
+                selectionList.add(error)
+            except (RuntimeError, TypeError):
+                continue
+
+        OpenMaya2.MGlobal.setActiveSelectionList(selectionList)
 
     # ------------------------------------------------------------------------
 
@@ -206,11 +226,13 @@ class QualityAssurance(object):
         Subclass of Maya's ls command. This command should be used to get the
         nodes in a quality assurance check. This will automatically take into
         account of the check should only run on selected objects or not.
+        The results are shared between checks ran within the same
+        cache.CacheContext.
 
         :return: Object list
         :rtype: list
         """
-        return cmds.ls(sl=self.onSelected, **kwargs) or []
+        return list(cache.ls(sl=self.onSelected, **kwargs))
 
     def lsApi(self, nodeType=OpenMaya.MFn.kTransform):
         """
@@ -236,3 +258,60 @@ class QualityAssurance(object):
                 iterator.next()
 
         return OpenMaya.MItSelectionList(selectionList, nodeType)
+
+    def lsDagPaths(self, nodeType=OpenMaya2.MFn.kTransform):
+        """
+        Get the dag paths of all nodes of the provided node type using the
+        Python API 2.0. This command should be used to get the nodes in a
+        quality assurance check. This will automatically take into account
+        of the check should only run on selected objects or not. Instances
+        are only returned once. When selected transforms are processed the
+        non intermediate shapes of the provided node type below them are
+        returned.
+
+        :param int nodeType: maya.api.OpenMaya.MFn type
+        :return: Dag paths
+        :rtype: generator
+        """
+        if self.onSelected:
+            # get dag paths from active selection
+            found = set()
+            selectionList = OpenMaya2.MGlobal.getActiveSelectionList()
+            for i in range(selectionList.length()):
+                try:
+                    dagPath = selectionList.getDagPath(i)
+                except (RuntimeError, TypeError):
+                    continue
+
+                # extend selected transforms to their shapes
+                if dagPath.node().hasFn(nodeType):
+                    dagPaths = [dagPath]
+                else:
+                    dagPaths = [
+                        OpenMaya2.MDagPath(dagPath).extendToShape(j)
+                        for j in range(dagPath.numberOfShapesDirectlyBelow())
+                    ]
+                    dagPaths = [
+                        shapePath
+                        for shapePath in dagPaths
+                        if shapePath.hasFn(nodeType)
+                        and not OpenMaya2.MFnDagNode(
+                            shapePath
+                        ).isIntermediateObject
+                    ]
+
+                # yield dag paths that are not yet returned
+                for dagPath in dagPaths:
+                    fullPathName = dagPath.fullPathName()
+                    if fullPathName not in found:
+                        found.add(fullPathName)
+                        yield dagPath
+        else:
+            # get dag paths of all objects of nodetype
+            iterator = OpenMaya2.MItDag(OpenMaya2.MItDag.kDepthFirst, nodeType)
+            while not iterator.isDone():
+                dagPath = iterator.getPath()
+                if not dagPath.instanceNumber():
+                    yield dagPath
+
+                iterator.next()
@@ -1,4 +1,58 @@
-from maya import cmds
+from maya import cmds, OpenMaya
+from . import api, cache
+
+
+@cache.memoize
+def isReferenced(node):
+    """
+    Check if the node is referenced. The result is shared between checks that
+    are ran within the same cache.CacheContext.
+
+    :param str node:
+    :return: Referenced state
+    :rtype: bool
+    """
+    obj = api.toMObject(node)
+    return OpenMaya.MFnDependencyNode(obj).isFromReferencedFile()
+
+
+@cache.memoize
+def hasReferences():
+    """
+    Check if the scene contains any references. The result is shared between
+    checks that are ran within the same cache.CacheContext.
+
+    :return: Reference state
+    :rtype: bool
+    """
+    return bool(cmds.file(query=True, reference=True))
+
+
+@cache.memoize
+def getNonReferenced(nodes):
+    """
+    Get all nodes that are not referenced. The referenced nodes are queried
+    using a single ls command, the short and long names of the referenced
+    nodes are stored so nodes can be provided in either form. If the scene
+    doesn't contain any references the nodes are returned without querying
+    them. The result is shared between checks that are ran within the same
+    cache.CacheContext.
+
+    :param list nodes: List of strings
+    :return: Nodes that are not referenced
+    :rtype: list
+    """
+    if not nodes or not hasReferences():
+        return list(nodes)
+
+    referenced = cmds.ls(nodes, referencedNodes=True) or []
+    if not referenced:
+        return list(nodes)
+
+    referenced = set(referenced)
+    referenced.update(cmds.ls(list(referenced), long=True) or [])
+
+    return [node for node in nodes if node not in referenced]
 
 
 def removeReferenced(nodes):
@@ -9,8 +63,5 @@ def removeReferenced(nodes):
     :return: Filtered list without referenced nodes
     :rtype: generator
     """
-    for node in nodes:
-        if cmds.referenceQuery(node, inr=True):
-            continue
-
+    for node in getNonReferenced(list(nodes)):
         yield node
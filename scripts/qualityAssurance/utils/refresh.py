@@ -0,0 +1,27 @@
+from maya import cmds
+
+
+class RefreshContext(object):
+    """
+    This context will suspend the refreshing of the viewports while the code
+    within the context is ran. Contexts can be nested, the viewports will
+    resume refreshing once the outer most context is exited.
+
+    .. code-block:: python
+
+        with RefreshContext():
+            # code
+    """
+    depth = 0
+
+    def __enter__(self):
+        if not RefreshContext.depth:
+            cmds.refresh(suspend=True)
+
+        RefreshContext.depth += 1
+
+    def __exit__(self, *exc_info):
+        RefreshContext.depth -= 1
+
+        if not RefreshContext.depth:
+            cmds.refresh(suspend=False)
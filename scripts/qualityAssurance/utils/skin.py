@@ -1,71 +1,169 @@
-from maya import cmds, OpenMaya, OpenMayaAnim
+from maya import cmds
+from maya.api import OpenMaya as OpenMaya2
+from . import cache, undo
 
 
+class DisableNormalizeContext(object):
+    """
+    This context will disable the normalization of the skin cluster while
+    the weights are edited, the normalization state is restored when the
+    context is exited. This prevents the weights from being normalized after
+    every weight that is set.
+
+    .. code-block:: python
+
+        with DisableNormalizeContext(skinCluster):
+            # code
+    """
+    def __init__(self, skinCluster):
+        self._attribute = "{0}.normalizeWeights".format(skinCluster)
+        self._normalize = None
+
+    def __enter__(self):
+        self._normalize = cmds.getAttr(self._attribute)
+        cmds.setAttr(self._attribute, 0)
+
+    def __exit__(self, *exc_info):
+        cmds.setAttr(self._attribute, self._normalize)
+
+
+# ----------------------------------------------------------------------------
+
+
+def toHashCode(skinFn):
+    """
+    :param maya.api.OpenMayaAnim.MFnSkinCluster skinFn:
+    :return: Hash code of the skin cluster node
+    :rtype: int
+    """
+    return OpenMaya2.MObjectHandle(skinFn.object()).hashCode()
+
+
+@cache.memoizeByKey(toHashCode)
 def getInfluencesApi(skinFn):
     """
-    Get influence data from a skin cluster
+    Get influence data from a skin cluster, the result is shared between
+    checks that are ran within the same cache.CacheContext.
     Code written by Tyler Thornock: http://www.charactersetup.com/home.html
     
-    :param OpenMayaAnim.MFnSkinCluster skinFn:
+    :param maya.api.OpenMayaAnim.MFnSkinCluster skinFn:
     :return: Influences dictionary and list
     :rtype: tuple()
     """
     # get the MDagPath for all influence
-    infDags = OpenMaya.MDagPathArray()
-    skinFn.influenceObjects(infDags)
+    infDags = skinFn.influenceObjects()
     
     # create dictionary with MDagPath
     # create list with full path of influences
     infIds = {}
     infPaths = []
-    for x in xrange(infDags.length()):
-        infPath = infDags[x].fullPathName()
-        infId = int(skinFn.indexForInfluenceObject(infDags[x]))
+    for x, infDag in enumerate(infDags):
+        infPath = infDag.fullPathName()
+        infId = int(skinFn.indexForInfluenceObject(infDag))
         infIds[infId] = x
         infPaths.append(infPath)
         
     return infIds, infPaths
     
     
+def getWeightsApiBulk(skinFn):
+    """
+    Get skin weights from a skin cluster using a single getWeights call on
+    all vertices of the deformed mesh. The weights are returned as a flat
+    array together with the number of influences, the weights of a vertex
+    are stored next to each other in the order of the influence indices
+    used in the influences dictionary returned by getInfluencesApi. If the
+    skin cluster doesn't deform a single mesh None is returned.
+
+    :param maya.api.OpenMayaAnim.MFnSkinCluster skinFn:
+    :return: Skin weights and number of influences
+    :rtype: tuple/None
+    """
+    # get deformed mesh
+    if skinFn.numOutputConnections() != 1:
+        return
+
+    dagPath = skinFn.getPathAtIndex(skinFn.indexForOutputConnection(0))
+    if not dagPath.hasFn(OpenMaya2.MFn.kMesh):
+        return
+
+    # create component of all vertices
+    numVertices = OpenMaya2.MFnMesh(dagPath).numVertices
+    componentFn = OpenMaya2.MFnSingleIndexedComponent()
+    components = componentFn.create(OpenMaya2.MFn.kMeshVertComponent)
+    componentFn.setCompleteData(numVertices)
+
+    # get weights, reading the weights doesn't change the scene so the undo
+    # queue is suspended
+    try:
+        with undo.UndoContext(readonly=True):
+            weights, numInfluences = skinFn.getWeights(dagPath, components)
+    except RuntimeError:
+        return
+
+    return weights, numInfluences
+
+
 def getWeightsApiGenerator(skinFn, infIds):
     """
     Get skin weights from a skin cluster reading its attributes.
     Code written by Tyler Thornock: http://www.charactersetup.com/home.html
     
-    :param OpenMayaAnim.MFnSkinCluster skinFn:
+    :param maya.api.OpenMayaAnim.MFnSkinCluster skinFn:
     :param dict infIds:
     :return: Skin weights per vertex
     :rtype: generator
     """
-    wlPlug = skinFn.findPlug("weightList")
-    wPlug = skinFn.findPlug("weights")
+    # get weights in bulk if possible, the weights are split per vertex
+    # while iterating
+    bulk = getWeightsApiBulk(skinFn)
+    if bulk is not None:
+        weights, numInfluences = bulk
+        influences = range(numInfluences)
+        for offset in range(0, len(weights), numInfluences):
+            vWeights = {}
+            for i in influences:
+                w = weights[offset + i]
+                if w:
+                    vWeights[i] = w
+
+            yield vWeights
+
+        return
+
+    wlPlug = skinFn.findPlug("weightList", False)
+    wPlug = skinFn.findPlug("weights", False)
     wlAttr = wlPlug.attribute()
     wAttr = wPlug.attribute()
-    wInfIds = OpenMaya.MIntArray()
+
+    # create a copy of the wPlug, this copy will point to the weight of each
+    # influence while the wPlug is used to query the existing indices
+    infPlug = OpenMaya2.MPlug(wPlug)
+    getInfIndex = infIds.get
 
     # the weights are stored in dictionary, the key is the vertId, 
     # the value is another dictionary whose key is the influence id and 
     # value is the weight for that influence
-    for vId in xrange(wlPlug.numElements()):
+    for vId in range(wlPlug.numElements()):
         vWeights = {}
-        # tell the weights attribute which vertex id it represents
+        # tell the weights attributes which vertex id they represent
         wPlug.selectAncestorLogicalIndex(vId, wlAttr)
+        infPlug.selectAncestorLogicalIndex(vId, wlAttr)
         
         # get the indice of all non-zero weights for this vert
-        wPlug.getExistingArrayAttributeIndices(wInfIds)
+        wInfIds = wPlug.getExistingArrayAttributeIndices()
 
-        # create a copy of the current wPlug
-        infPlug = OpenMaya.MPlug(wPlug)
         for infId in wInfIds:
+            # ignore removed influences
+            index = getInfIndex(infId)
+            if index is None:
+                continue
+
             # tell the infPlug it represents the current influence id
             infPlug.selectAncestorLogicalIndex(infId, wAttr)
             
             # add this influence and its weight to this verts weights
-            try:
-                vWeights[infIds[infId]] = infPlug.asDouble()
-            except KeyError:
-                # assumes a removed influence
-                pass
+            vWeights[index] = infPlug.asDouble()
                 
         yield vWeights
     
@@ -75,43 +173,10 @@ def getWeightsApi(skinFn, infIds):
     Get skin weights from a skin cluster reading its attributes.
     Code written by Tyler Thornock: http://www.charactersetup.com/home.html
     
-    :param OpenMayaAnim.MFnSkinCluster skinFn:
+    :param maya.api.OpenMayaAnim.MFnSkinCluster skinFn:
     :param dict infIds:
     :return: Dictionary of skin weights.
     :rtype: dict
     """
-    weights = {}
-    
-    wlPlug = skinFn.findPlug("weightList")
-    wPlug = skinFn.findPlug("weights")
-    wlAttr = wlPlug.attribute()
-    wAttr = wPlug.attribute()
-    wInfIds = OpenMaya.MIntArray()
-
-    # the weights are stored in dictionary, the key is the vertId, 
-    # the value is another dictionary whose key is the influence id and 
-    # value is the weight for that influence
-    for vId in xrange(wlPlug.numElements()):
-        vWeights = {}
-        # tell the weights attribute which vertex id it represents
-        wPlug.selectAncestorLogicalIndex(vId, wlAttr)
-        
-        # get the indice of all non-zero weights for this vert
-        wPlug.getExistingArrayAttributeIndices(wInfIds)
-
-        # create a copy of the current wPlug
-        infPlug = OpenMaya.MPlug(wPlug)
-        for infId in wInfIds:
-            # tell the infPlug it represents the current influence id
-            infPlug.selectAncestorLogicalIndex(infId, wAttr)
-            
-            # add this influence and its weight to this verts weights
-            try:
-                vWeights[infIds[infId]] = infPlug.asDouble()
-            except KeyError:
-                # assumes a removed influence
-                pass
-                
-        weights[vId] = vWeights
-        
-    return weights
+    with undo.UndoContext(readonly=True):
+        return dict(enumerate(getWeightsApiGenerator(skinFn, infIds)))
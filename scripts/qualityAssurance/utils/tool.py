@@ -0,0 +1,34 @@
+from maya import cmds
+
+
+class SelectToolContext(object):
+    """
+    This context will activate the select tool while the code within the
+    context is ran. Selecting and editing nodes and components can be a lot
+    slower when a manipulator tool is active. Contexts can be nested, the
+    previously active tool will be restored once the outer most context is
+    exited.
+
+    .. code-block:: python
+
+        with SelectToolContext():
+            # code
+    """
+    depth = 0
+    tool = None
+
+    def __enter__(self):
+        if not SelectToolContext.depth and not cmds.about(batch=True):
+            tool = cmds.currentCtx()
+            if tool != "selectSuperContext":
+                SelectToolContext.tool = tool
+                cmds.setToolTo("selectSuperContext")
+
+        SelectToolContext.depth += 1
+
+    def __exit__(self, *exc_info):
+        SelectToolContext.depth -= 1
+
+        if not SelectToolContext.depth and SelectToolContext.tool:
+            cmds.setToolTo(SelectToolContext.tool)
+            SelectToolContext.tool = None
@@ -4,15 +4,36 @@ from maya import cmds
 class UndoContext(object):
     """
     This context will create a undo chunk of every commands that is ran within
-    the context.
+    the context. When the context is read only the undo queue will be
+    suspended instead, the commands ran within the context will not be
+    recorded. The undo queue is suspended without flushing it, the state of
+    the undo queue is restored when the context is exited.
 
     .. code-block:: python
     
-        with UndoContext:
+        with UndoContext():
+            # code
+
+        with UndoContext(readonly=True):
             # code
     """
+    def __init__(self, readonly=False):
+        self._readonly = readonly
+        self._state = None
+
     def __enter__(self):
-        cmds.undoInfo(openChunk=True)
+        if not self._readonly:
+            cmds.undoInfo(openChunk=True)
+            return
+
+        self._state = cmds.undoInfo(query=True, state=True)
+        if self._state:
+            cmds.undoInfo(stateWithoutFlush=False)
 
     def __exit__(self, *exc_info):
-        cmds.undoInfo(closeChunk=True)
+        if not self._readonly:
+            cmds.undoInfo(closeChunk=True)
+            return
+
+        if self._state:
+            cmds.undoInfo(stateWithoutFlush=True)